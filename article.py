@@ -2,46 +2,75 @@ import os
 import json
 import subprocess
 import requests
-import openai
+import re
 import time
 import shutil
-from io import BytesIO
-from langchain_community.chat_models import ChatOpenAI
-from langchain_community.document_loaders import WebBaseLoader
-from langchain.schema import HumanMessage, SystemMessage
-from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.prompts import ChatPromptTemplate
-from pydantic import BaseModel, Field
-from gtts import gTTS
+import uuid
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from tenacity import AsyncRetrying, Retrying, stop_after_attempt, wait_exponential
 from PIL import Image, ImageDraw, ImageFont
-from pydub import AudioSegment
 from config import config, logger
+from monitoring.tracing import Span, StageTimer, current_trace, file_size, record_llm_call
+from cache.asset_cache import asset_cache
+from tts.backends import get_tts_backend
 
 # ====================================
 # 초기화 및 설정
 # ====================================
+# langchain / openai / gTTS 등 무거운 라이브러리와 클라이언트는 처음 사용할 때 로드합니다.
+# (오버레이/인코딩만 하는 프로세스 풀 워커는 이 모듈을 import 해도 로드하지 않음)
 os.environ["OPENAI_API_KEY"] = config["OPENAI_API_KEY"]
-openai.api_key = config["OPENAI_API_KEY"]
+
+
+@lru_cache(maxsize=None)
+def get_openai():
+    """openai 모듈 로드 및 API 키 설정 (최초 1회)"""
+    import openai
+
+    openai.api_key = config["OPENAI_API_KEY"]
+    return openai
 
 # 출력 디렉토리 설정
 OUTPUT_DIR = config.get('output_directory', 'output')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
-os.makedirs(os.path.join(OUTPUT_DIR, "temp"), exist_ok=True)
 
 # ====================================
 # 유틸리티 함수
 # ====================================
 
 
-def get_temp_filepath(filename: str) -> str:
+def create_workspace(run_id: str = None) -> str:
+    """파이프라인 실행 1회 전용 작업 디렉토리를 생성합니다. (동시 실행 시 파일 충돌 방지)"""
+    workspace = os.path.join(OUTPUT_DIR, "runs", run_id or uuid.uuid4().hex)
+    os.makedirs(os.path.join(workspace, "temp"), exist_ok=True)
+    return workspace
+
+
+def remove_workspace(workspace: str) -> None:
+    """작업 디렉토리를 결과물까지 모두 삭제합니다."""
+    shutil.rmtree(workspace, ignore_errors=True)
+
+
+def get_temp_filepath(workspace: str, filename: str) -> str:
     """임시 파일 경로를 생성하는 헬퍼 함수"""
-    return os.path.join(OUTPUT_DIR, "temp", filename)
+    return os.path.join(workspace, "temp", filename)
+
+
+def get_output_filepath(workspace: str, filename: str) -> str:
+    """최종 결과물 파일 경로를 생성하는 헬퍼 함수"""
+    return os.path.join(workspace, filename)
 
 
-def cleanup_temp_files() -> None:
+def cleanup_temp_files(workspace: str) -> None:
     """임시 파일들을 정리합니다."""
     try:
-        temp_dir = os.path.join(OUTPUT_DIR, "temp")
+        temp_dir = os.path.join(workspace, "temp")
         if os.path.exists(temp_dir):
             for file in os.listdir(temp_dir):
                 file_path = os.path.join(temp_dir, file)
@@ -51,124 +80,317 @@ def cleanup_temp_files() -> None:
     except Exception as e:
         logger.error(f"[임시 파일 정리 오류] {e}")
 
-# 폰트 로드 (한 번만 수행)
+# 폰트 로드 (크기별로 한 번만 수행)
+DEFAULT_FONT_PATH = 'GmarketSansTTFBold.ttf'  # bitenews 디렉토리 내의 폰트 파일
 
 
-def load_font():
-    """폰트를 한 번만 로드하는 함수"""
-    # 기본 폰트 경로 설정 - bitenews 디렉토리 내의 폰트 파일
-    default_font_path = 'GmarketSansTTFBold.ttf'
-    font_path = config.get('font_file', default_font_path)
-    font_size = config.get('font_size', 50)
+@lru_cache(maxsize=None)
+def get_font(size):
+    """크기별 폰트 객체 (최초 사용 시 1회 로드 후 재사용 - 글리프 메트릭도 폰트 객체에 캐시됨)"""
+    font_path = config.get('font_file', DEFAULT_FONT_PATH)
 
-    try:
-        font = ImageFont.truetype(font_path, size=font_size)
-        logger.info(f"{font_path} 폰트 로드 성공")
-        return font
-    except IOError:
-        # 기본 경로로 다시 시도
+    for path in dict.fromkeys([font_path, DEFAULT_FONT_PATH]):
         try:
-            font = ImageFont.truetype(default_font_path, size=font_size)
-            logger.info(f"{default_font_path} 폰트 로드 성공")
+            font = ImageFont.truetype(path, size=size)
+            logger.info(f"{path} 폰트 로드 성공 ({size}px)")
             return font
         except IOError:
-            logger.warning("폰트 파일을 찾을 수 없어 기본 폰트를 사용합니다.")
-            return ImageFont.load_default()
+            continue
 
+    logger.warning("폰트 파일을 찾을 수 없어 기본 폰트를 사용합니다.")
+    return ImageFont.load_default()
 
-# 전역 변수로 폰트 로드
-OVERLAY_FONT = load_font()
 
 # ====================================
 # 뉴스 시나리오 생성 모델 설정
 # ====================================
 # GPT 모델 설정
 model_config = config.get('model', {})
-model = ChatOpenAI(
-    model_name=model_config.get('name', 'gpt-4o-mini'),
-    temperature=model_config.get('temperature', 0.7),
-    max_tokens=model_config.get('max_tokens', 1000),
-)
+SCENARIO_MODEL_NAME = model_config.get('name', 'gpt-4o-mini')
 
-# Pydantic을 이용한 JSON 출력 구조 정의
+# Pydantic을 이용한 JSON 출력 구조 정의 (모델 응답은 이 스키마로 검증)
 
 
 class Scene(BaseModel):
-    scene: int = Field(description="씬 번호 (1~4)")
-    dialogue: str = Field(description="해당 씬의 대화 및 설명 (최소 40단어)")
+    scene: int = Field(description="씬 번호 (1~4)", ge=1, le=4)
+    dialogue: str = Field(description="해당 씬의 대화 및 설명 (최소 40단어)", min_length=1)
 
 
 class Scenario(BaseModel):
-    title: str = Field(description="유튜브 쇼츠 제목 (8자 이내)", max_length=8)
-    scenes: list[Scene] = Field(description="4개의 뉴스 씬 정보 배열")
+    title: str = Field(description="유튜브 쇼츠 제목 (8자 이내)", min_length=1, max_length=8)
+    scenes: list[Scene] = Field(description="4개의 뉴스 씬 정보 배열", min_length=4, max_length=4)
+
+    @model_validator(mode="after")
+    def check_scene_numbers(self):
+        # 씬 번호가 겹치면 같은 파일(scene_N.*)에 동시에 쓰고 한 씬이 두 번 렌더링됨
+        if {scene.scene for scene in self.scenes} != {1, 2, 3, 4}:
+            raise ValueError("씬 번호는 1, 2, 3, 4가 한 번씩 있어야 합니다.")
+        return self
+
+
+# 기사 본문 토큰 예산 / 재시도 설정
+SCENARIO_MAX_INPUT_TOKENS = config["SCENARIO_MAX_INPUT_TOKENS"]
+SCENARIO_MAX_ATTEMPTS = config["SCENARIO_MAX_ATTEMPTS"]
+SENTENCE_END = re.compile(r"[.!?。](?=\s|$)")
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer():
+    """시나리오 모델 토크나이저 (tiktoken 미설치 시 None → 글자 수로 추정)"""
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken이 없어 글자 수로 토큰 수를 추정합니다.")
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(SCENARIO_MODEL_NAME)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def trim_to_token_budget(text, max_tokens=SCENARIO_MAX_INPUT_TOKENS):
+    """기사 본문을 토큰 예산에 맞게 앞부분만 남김 (뉴스는 앞부분에 핵심이 있으므로 요약 대신 절단)
+
+    문장 중간에서 잘리지 않도록 마지막 문장 끝까지만 사용합니다.
+    """
+    tokenizer = get_tokenizer()
+    if tokenizer is not None:
+        tokens = tokenizer.encode(text)
+        token_count = len(tokens)
+        if token_count <= max_tokens:
+            return text
+        trimmed = tokenizer.decode(tokens[:max_tokens])
+    else:
+        # 한국어는 대략 1글자 ≤ 1토큰 → 글자 수를 토큰 수로 보수적으로 사용
+        token_count = len(text)
+        if token_count <= max_tokens:
+            return text
+        trimmed = text[:max_tokens]
+
+    sentence_ends = [match.end() for match in SENTENCE_END.finditer(trimmed)]
+    if sentence_ends and sentence_ends[-1] > len(trimmed) // 2:
+        trimmed = trimmed[:sentence_ends[-1]]
+
+    logger.info(f"[시나리오 입력 절단] 약 {token_count} → {max_tokens} 토큰 ({len(text)} → {len(trimmed)}자)")
+    return trimmed
+
+
+@lru_cache(maxsize=None)
+def get_scenario_chains():
+    """(시나리오 생성 체인, JSON 복구 체인) - 최초 사용 시 1회 생성
+
+    두 체인 모두 모델 응답(AIMessage)을 그대로 반환하고, 파싱/검증은 parse_scenario에서 합니다.
+    """
+    from langchain_community.chat_models import ChatOpenAI
+    from langchain_core.output_parsers import JsonOutputParser
+    from langchain_core.prompts import ChatPromptTemplate
+
+    model = ChatOpenAI(
+        model_name=SCENARIO_MODEL_NAME,
+        temperature=model_config.get('temperature', 0.7),
+        max_tokens=model_config.get('max_tokens', 1000),
+        request_timeout=model_config.get('request_timeout', 60),
+        max_retries=0,  # 재시도는 generate_scenario에서 백오프와 함께 처리
+    )
+
+    # JSON 응답을 강제하는 포맷 지시사항
+    format_instructions = JsonOutputParser(pydantic_object=Scenario).get_format_instructions()
+
+    # 프롬프트 정의
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "당신은 유튜브 쇼츠용 뉴스 시나리오 제작자입니다. "
+         "주어진 뉴스를 바탕으로 **기승전결 구조(1,2,3,4)의 스토리텔링 뉴스 시나리오**를 작성하세요. "
+         "각 씬은 **최소 20단어 이상**이어야 하며, **실제 뉴스 앵커가 보도하는 스타일**로 작성해야 합니다."),
+        ("user",
+         "#Format: {format_instructions}\n\n#News Title: {news_title}\n\n#News Article: {news_text}")
+    ]).partial(format_instructions=format_instructions)
+
+    # 스키마에 맞지 않는 응답을 오류 내용과 함께 다시 보내 수정 요청
+    repair_prompt = ChatPromptTemplate.from_messages([
+        ("system", "당신은 JSON 형식 교정기입니다. 주어진 응답을 형식 지시사항과 오류 내용에 맞게 고친 "
+         "JSON만 출력하세요. 내용은 최대한 유지하고, 제목이 너무 길면 뜻을 살려 줄이세요."),
+        ("user", "#Format: {format_instructions}\n\n#Error: {error}\n\n#Response: {output}")
+    ]).partial(format_instructions=format_instructions)
+
+    return prompt | model, repair_prompt | model
+
+
+@lru_cache(maxsize=None)
+def get_token_usage_handler_class():
+    """LLM 응답의 토큰 사용량을 모으는 콜백 클래스 (langchain은 처음 사용할 때 로드)"""
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class TokenUsageHandler(BaseCallbackHandler):
+        def __init__(self):
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+
+        def on_llm_end(self, response, **kwargs):
+            usage = (response.llm_output or {}).get("token_usage")
+            if usage:
+                self.prompt_tokens += usage.get("prompt_tokens", 0)
+                self.completion_tokens += usage.get("completion_tokens", 0)
+                return
+
+            # llm_output이 없는 모델은 메시지의 usage_metadata 사용
+            for generations in response.generations:
+                for generation in generations:
+                    metadata = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                    self.prompt_tokens += metadata.get("input_tokens", 0)
+                    self.completion_tokens += metadata.get("output_tokens", 0)
+
+    return TokenUsageHandler
+
+
+@contextmanager
+def track_llm_call(call):
+    """LLM 호출 1회의 소요 시간 / 토큰 수 / 성공 여부 기록 (yield된 콜백을 체인 config에 전달)"""
+    handler = get_token_usage_handler_class()()
+    start, status = time.perf_counter(), "error"
+    try:
+        yield handler
+        status = "success"
+    finally:
+        record_llm_call(call, time.perf_counter() - start,
+                        handler.prompt_tokens, handler.completion_tokens, status)
+
 
+def parse_scenario(text):
+    """모델 응답을 JSON으로 파싱하고 Scenario 스키마로 검증 (실패 시 ValueError / ValidationError)"""
+    from langchain_core.output_parsers import JsonOutputParser
 
-# JSON 파서 설정
-parser = JsonOutputParser(pydantic_object=Scenario)
+    scenario = Scenario.model_validate(JsonOutputParser().parse(text))
+    scenario.scenes.sort(key=lambda scene: scene.scene)
+    return scenario.model_dump()
 
-# 프롬프트 정의
-prompt = ChatPromptTemplate.from_messages([
-    ("system", "당신은 유튜브 쇼츠용 뉴스 시나리오 제작자입니다. "
-     "주어진 뉴스를 바탕으로 **기승전결 구조(1,2,3,4)의 스토리텔링 뉴스 시나리오**를 작성하세요. "
-     "각 씬은 **최소 20단어 이상**이어야 하며, **실제 뉴스 앵커가 보도하는 스타일**로 작성해야 합니다."),
-    ("user",
-     "#Format: {format_instructions}\n\n#News Title: {news_title}\n\n#News Article: {news_text}")
-])
 
-# JSON 응답을 강제하는 포맷 지시사항을 프롬프트에 주입
-prompt = prompt.partial(format_instructions=parser.get_format_instructions())
+def scenario_retry_policy(retrying_class=Retrying):
+    """시나리오 생성 재시도 정책 (API 오류 / 복구 실패 시 지수 백오프, 최대 SCENARIO_MAX_ATTEMPTS회)"""
+    return retrying_class(
+        stop=stop_after_attempt(SCENARIO_MAX_ATTEMPTS),
+        wait=wait_exponential(multiplier=1, max=10),
+        before_sleep=lambda state: logger.warning(
+            f"[시나리오 생성 재시도] {state.attempt_number}회 실패: {state.outcome.exception()}"),
+        reraise=True,
+    )
+
+
+def _scenario_inputs(news_text, title):
+    return {"news_text": trim_to_token_budget(news_text), "news_title": title}
+
+
+def _scenario_cache_key(news_text, title):
+    return asset_cache.make_key(SCENARIO_MODEL_NAME, SCENARIO_MAX_INPUT_TOKENS, title, news_text)
+
+
+def _save_scenario(workspace, scenario_obj):
+    with open(get_temp_filepath(workspace, "scenario.json"), "w", encoding="utf-8") as f:
+        json.dump(scenario_obj, f, ensure_ascii=False, indent=2)
 
 # ====================================
 # 주요 기능 함수
 # ====================================
 
 
-def generate_scenario(news_text, title):
-    """뉴스 기사를 기반으로 4개의 씬으로 구성된 뉴스 스토리 생성"""
+def _generate_scenario_once(inputs):
+    """시나리오 생성 1회 - 스키마에 맞지 않으면 복구 체인으로 1회 수정"""
+    chain, repair_chain = get_scenario_chains()
+    with track_llm_call("generate") as handler:
+        output = chain.invoke(inputs, config={"callbacks": [handler]}).content
+
+    try:
+        return parse_scenario(output)
+    except (ValueError, ValidationError) as e:
+        logger.warning(f"[시나리오 형식 오류 → 복구 요청] {e}")
+        with track_llm_call("repair") as handler:
+            repaired = repair_chain.invoke(
+                {"output": output, "error": str(e)}, config={"callbacks": [handler]}).content
+        return parse_scenario(repaired)
+
+
+async def _agenerate_scenario_once(inputs):
+    """_generate_scenario_once의 비동기 버전"""
+    chain, repair_chain = get_scenario_chains()
+    with track_llm_call("generate") as handler:
+        output = (await chain.ainvoke(inputs, config={"callbacks": [handler]})).content
+
     try:
-        # 랭체인 구성 및 실행
-        chain = prompt | model | parser
-        scenario_obj = chain.invoke(
-            {"news_text": news_text, 'news_title': title})
+        return parse_scenario(output)
+    except (ValueError, ValidationError) as e:
+        logger.warning(f"[시나리오 형식 오류 → 복구 요청] {e}")
+        with track_llm_call("repair") as handler:
+            repaired = (await repair_chain.ainvoke(
+                {"output": output, "error": str(e)}, config={"callbacks": [handler]})).content
+        return parse_scenario(repaired)
+
+
+def generate_scenario(news_text, title, workspace):
+    """뉴스 기사를 기반으로 4개의 씬으로 구성된 뉴스 스토리 생성 (모든 시도 실패 시 None 반환)"""
+    cache_key = _scenario_cache_key(news_text, title)
+
+    scenario_obj = asset_cache.get_json("scenario", cache_key)
+    if scenario_obj:
+        logger.info("[시나리오 캐시 사용]")
+    else:
+        try:
+            inputs = _scenario_inputs(news_text, title)
+            for attempt in scenario_retry_policy():
+                with attempt:
+                    scenario_obj = _generate_scenario_once(inputs)
+        except Exception as e:
+            logger.error(f"[GPT API 오류] 시나리오 생성 실패 ({SCENARIO_MAX_ATTEMPTS}회 시도): {e}")
+            return None
+        # 검증을 통과한 시나리오만 캐시
+        asset_cache.put_json("scenario", cache_key, scenario_obj)
         logger.info("GPT API로부터 시나리오 생성 완료")
 
-        # JSON 저장
-        with open(get_temp_filepath("scenario.json"), "w", encoding="utf-8") as f:
-            json.dump(scenario_obj, f, ensure_ascii=False, indent=2)
+    _save_scenario(workspace, scenario_obj)
+    return scenario_obj
 
-        return scenario_obj
-    except Exception as e:
-        logger.error(f"[GPT API 오류] {e}")
-        # 오류 발생 시 기본 시나리오 반환
-        return {
-            "title": "Dummy 제목",
-            "scenes": [
-                {"scene": 1, "dialogue": "Dummy 기: 뉴스 기사의 핵심 내용을 요약한 내용입니다."},
-                {"scene": 2, "dialogue": "Dummy 승: 상황 전개와 인물들의 발언을 요약한 내용입니다."},
-                {"scene": 3, "dialogue": "Dummy 전: 경제·정치적 영향을 설명한 내용입니다."},
-                {"scene": 4, "dialogue": "Dummy 결: 결론 및 전망을 제시한 내용입니다."}
-            ]
-        }
-
-
-def generate_image(scene_dialogue, scene_number, fallback_images=None):
-    """DALL·E로 뉴스 보도 스타일 이미지 생성, 실패 시 대체 이미지 사용"""
-    # 이미지 파일명 설정
-    filename = get_temp_filepath(f"scene_{scene_number}.png")
 
-    # 캐시된 이미지 확인
-    if os.path.exists(filename):
-        logger.info(f"[이미지 캐시 사용] {filename}")
-        return filename
+async def agenerate_scenario(news_text, title, workspace):
+    """generate_scenario의 비동기 버전 - 여러 기사의 시나리오를 asyncio.gather로 동시에 생성할 때 사용"""
+    cache_key = _scenario_cache_key(news_text, title)
+
+    scenario_obj = asset_cache.get_json("scenario", cache_key)
+    if scenario_obj:
+        logger.info("[시나리오 캐시 사용]")
+    else:
+        try:
+            inputs = _scenario_inputs(news_text, title)
+            async for attempt in scenario_retry_policy(AsyncRetrying):
+                with attempt:
+                    scenario_obj = await _agenerate_scenario_once(inputs)
+        except Exception as e:
+            logger.error(f"[GPT API 오류] 시나리오 생성 실패 ({SCENARIO_MAX_ATTEMPTS}회 시도): {e}")
+            return None
+        asset_cache.put_json("scenario", cache_key, scenario_obj)
+        logger.info("GPT API로부터 시나리오 생성 완료")
+
+    _save_scenario(workspace, scenario_obj)
+    return scenario_obj
+
+
+def generate_image(scene_dialogue, scene_number, workspace):
+    """DALL·E로 뉴스 보도 스타일 이미지 생성 (실패 시 None 반환)"""
+    # 이미지 파일명 설정
+    filename = get_temp_filepath(workspace, f"scene_{scene_number}.png")
 
     # 뉴스 보도 스타일 프롬프트
     prompt = "현대적인 한국 뉴스 보도 스타일의 고품질, 사실적인 1024x1024 이미지를 생성하세요. " \
              "이 이미지는 실제 뉴스 방송 화면이나 온라인 뉴스 기사에서 볼 수 있는 장면처럼 보이도록 구성해야 합니다. " \
              f"이미지는 다음 뉴스 내용을 반영해야 합니다: {scene_dialogue}"
 
+    # 캐시된 이미지 확인 (프롬프트 + 모델 기준)
+    cache_key = asset_cache.make_key("dall-e-3", "1024x1024", prompt)
+    if asset_cache.fetch("image", cache_key, ".png", filename):
+        logger.info(f"[이미지 캐시 사용] {filename}")
+        return filename
+
     try:
         # DALL-E 이미지 생성 API 호출
-        response = openai.Image.create(
+        response = get_openai().Image.create(
             model="dall-e-3",
             prompt=prompt,
             n=1,
@@ -180,20 +402,28 @@ def generate_image(scene_dialogue, scene_number, fallback_images=None):
         image_data = requests.get(image_url).content
         with open(filename, "wb") as f:
             f.write(image_data)
+        asset_cache.put("image", cache_key, ".png", filename)
 
         logger.info(f"[이미지 생성] {filename} 1024x1024 생성 완료")
         return filename
 
     except Exception as e:
         logger.error(f"[이미지 생성 오류] {e}")
+        return None
+
+
+def apply_fallback_image(scene_number, workspace, fallback_images=None):
+    """이미지 생성에 실패한 씬에 다른 씬의 이미지를 대체 이미지로 복사"""
+    filename = get_temp_filepath(workspace, f"scene_{scene_number}.png")
 
+    try:
         # 대체 이미지 활용 로직: 개선된 포괄적 파이프라인
         if fallback_images and len(fallback_images) > 0:
             # 1. 기존 대체 로직 유지
             if scene_number == 1:
                 # scene1 실패 시: 우선 scene2, 없으면 scene3, scene4 순으로 시도
                 for check_scene in range(2, 5):
-                    check_path = get_temp_filepath(f"scene_{check_scene}.png")
+                    check_path = get_temp_filepath(workspace, f"scene_{check_scene}.png")
                     if os.path.exists(check_path):
                         logger.warning(
                             f"[대체 이미지 사용] 씬 1에 씬 {check_scene}의 이미지 사용")
@@ -211,7 +441,7 @@ def generate_image(scene_dialogue, scene_number, fallback_images=None):
 
                 # 먼저 바로 앞 씬 확인 (기존 로직)
                 prev_scene_path = get_temp_filepath(
-                    f"scene_{scene_number-1}.png")
+                    workspace, f"scene_{scene_number-1}.png")
                 if os.path.exists(prev_scene_path):
                     logger.warning(
                         f"[대체 이미지 사용] 씬 {scene_number}에 씬 {scene_number-1}의 이미지 사용")
@@ -224,7 +454,7 @@ def generate_image(scene_dialogue, scene_number, fallback_images=None):
                     if check_scene == scene_number:
                         continue
 
-                    check_path = get_temp_filepath(f"scene_{check_scene}.png")
+                    check_path = get_temp_filepath(workspace, f"scene_{check_scene}.png")
                     if os.path.exists(check_path):
                         logger.warning(
                             f"[대체 이미지 사용] 씬 {scene_number}에 씬 {check_scene}의 이미지 사용")
@@ -241,94 +471,152 @@ def generate_image(scene_dialogue, scene_number, fallback_images=None):
         # fallback_images가 없는 경우
         return None
 
+    except Exception as e:
+        logger.error(f"[대체 이미지 적용 오류] {e}")
+        return None
 
-def overlay_title_on_image(image_path, title, output_path):
-    """정사각형 이미지에 제목 텍스트를 오버레이하고 1080x1920 비율로 변환"""
-    font = OVERLAY_FONT
 
-    try:
-        # 원본 이미지 로드
-        image = Image.open(image_path)
-        banner_height = int(image.size[1] * 0.25)  # 상단 25% 영역
+def generate_scene_images(scenes, workspace):
+    """모든 씬의 이미지를 동시에 생성한 뒤, 실패한 씬에 대체 이미지를 적용
 
-        # 1080x1920 캔버스 생성 (유튜브 쇼츠 비율)
-        final_image = Image.new("RGB", (1080, 1920), "black")
-        draw = ImageDraw.Draw(final_image)
-
-        # 텍스트 폰트 크기 자동 조절
-        max_text_width = 1020  # 좌우 여백 30px
-        font_size = 50  # Default font size
-
-        while True:
-            try:
-                # 기본 폰트 경로 설정
-                default_font_path = 'GmarketSansTTFBold.ttf'
-
-                # 폰트 크기 조절을 위한 새 폰트 로드
-                current_font = ImageFont.truetype(
-                    default_font_path, size=font_size) if font != ImageFont.load_default() else font
-                bbox = draw.textbbox((0, 0), title, font=current_font)
-                text_width = bbox[2] - bbox[0]
-
-                # 적절한 폰트 크기 결정
-                if text_width <= max_text_width or font_size <= 20:
-                    font = current_font
-                    break
-
-                font_size -= 5
-
-            except Exception:
-                font = OVERLAY_FONT
-                break
-
-        # 텍스트 배치를 위한 측정
-        bbox = draw.textbbox((0, 0), title, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        # 텍스트가 너무 길면 여러 줄로 분할
-        if text_width > max_text_width:
-            words = title.split()
-            lines = []
-            current_line = ""
-
-            for word in words:
-                test_line = current_line + " " + word if current_line else word
-                bbox = draw.textbbox((0, 0), test_line, font=font)
-                test_width = bbox[2] - bbox[0]
-
-                if test_width <= max_text_width:
-                    current_line = test_line
-                else:
-                    lines.append(current_line)
-                    current_line = word
+    :return: [(scene_id, image_path), ...] (씬 순서 유지)
+    """
+    trace = current_trace()
 
-            if current_line:
-                lines.append(current_line)
+    def generate(scene):
+        with trace.span("image", scene["scene"]) as span:
+            image_path = generate_image(scene["dialogue"], scene["scene"], workspace)
+            span.add_file(image_path)
+            return image_path
+
+    # DALL·E 요청은 네트워크 대기 시간이 대부분이므로 스레드로 동시 요청 (동시 요청 수 제한)
+    max_workers = max(1, min(config["IMAGE_CONCURRENCY"], len(scenes)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image") as executor:
+        results = list(executor.map(generate, scenes))
+
+    # 모든 요청이 끝난 뒤 씬 순서대로 대체 이미지 적용
+    scene_images = []
+    successful_images = [path for path in results if path]
+
+    for scene, image_path in zip(scenes, results):
+        scene_id = scene["scene"]
 
-            # 여러 줄 텍스트 그리기
-            total_text_height = text_height * len(lines)
-            start_y = (banner_height - total_text_height) / 2
+        if not image_path:
+            image_path = apply_fallback_image(
+                scene_id, workspace, successful_images)
 
-            for i, line in enumerate(lines):
-                bbox = draw.textbbox((0, 0), line, font=font)
-                line_width = bbox[2] - bbox[0]
-                text_x = (1080 - line_width) / 2
-                text_y = start_y + i * text_height
-                draw.text((text_x, text_y), line, fill="white", font=font)
+        if image_path:
+            scene_images.append((scene_id, image_path))
+            if image_path not in successful_images:
+                successful_images.append(image_path)
+        else:
+            logger.warning(f"씬 {scene_id}의 이미지 생성 실패 및 대체 이미지도 없음")
+
+    return scene_images
+
+
+# 오버레이 캔버스 설정 (유튜브 쇼츠 비율)
+CANVAS_SIZE = (1080, 1920)
+SCENE_IMAGE_SIZE = (1024, 1024)
+MAX_TEXT_WIDTH = 1020  # 좌우 여백 30px
+TITLE_FONT_MIN_SIZE = 20
+
+# 씬 오버레이(ffmpeg 입력용 중간 파일) 포맷 - 썸네일만 PNG로 저장
+# bmp: 무압축이라 PNG 압축/해제 시간이 없음 (1080x1920 기준 수 ms vs 수백 ms)
+FRAME_FORMAT = config["FRAME_FORMAT"]
+
+
+def text_width(font, text):
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
+
+
+def fit_title_font(title):
+    """제목이 한 줄에 들어가는 가장 큰 폰트 (이진 탐색, 최소 크기에서도 넘치면 최소 크기 → 줄바꿈)"""
+    max_size = config.get('font_size', 50)
+    if not isinstance(get_font(max_size), ImageFont.FreeTypeFont):
+        # 기본(비트맵) 폰트는 크기 조절 불가
+        return get_font(max_size)
+
+    low, high = TITLE_FONT_MIN_SIZE, max_size
+    best = TITLE_FONT_MIN_SIZE
+    while low <= high:
+        size = (low + high) // 2
+        if text_width(get_font(size), title) <= MAX_TEXT_WIDTH:
+            best, low = size, size + 1
         else:
-            # 한 줄 텍스트 그리기
-            text_x = (1080 - text_width) / 2
-            text_y = (banner_height - text_height) / 2
-            draw.text((text_x, text_y), title, fill="white", font=font)
+            high = size - 1
+    return get_font(best)
+
+
+def render_title_banner(title, banner_height=int(SCENE_IMAGE_SIZE[1] * 0.25)):
+    """제목 배너 렌더링 (기사마다 1회 생성해 모든 씬/썸네일에 합성)
+
+    캔버스 상단부터 씬 이미지가 놓이는 위치까지의 영역을 반환합니다.
+    """
+    paste_y = banner_height + (CANVAS_SIZE[1] - banner_height - SCENE_IMAGE_SIZE[1]) // 2
+    banner = Image.new("RGB", (CANVAS_SIZE[0], paste_y), "black")
+    draw = ImageDraw.Draw(banner)
+    font = fit_title_font(title)
+
+    # 텍스트 배치를 위한 측정
+    bbox = draw.textbbox((0, 0), title, font=font)
+    text_width_px = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    # 텍스트가 너무 길면 여러 줄로 분할
+    if text_width_px > MAX_TEXT_WIDTH:
+        lines = []
+        current_line = ""
+
+        for word in title.split():
+            test_line = current_line + " " + word if current_line else word
+            if text_width(font, test_line) <= MAX_TEXT_WIDTH:
+                current_line = test_line
+            else:
+                lines.append(current_line)
+                current_line = word
+
+        if current_line:
+            lines.append(current_line)
+
+        # 여러 줄 텍스트 그리기
+        total_text_height = text_height * len(lines)
+        start_y = (banner_height - total_text_height) / 2
+
+        for i, line in enumerate(lines):
+            text_x = (CANVAS_SIZE[0] - text_width(font, line)) / 2
+            text_y = start_y + i * text_height
+            draw.text((text_x, text_y), line, fill="white", font=font)
+    else:
+        # 한 줄 텍스트 그리기
+        text_x = (CANVAS_SIZE[0] - text_width_px) / 2
+        text_y = (banner_height - text_height) / 2
+        draw.text((text_x, text_y), title, fill="white", font=font)
+
+    return banner
 
-        # 이미지 크기 조정 및 배치
-        new_width, new_height = 1024, 1024
-        image_resized = image.resize((new_width, new_height), Image.LANCZOS)
 
-        paste_x = (1080 - new_width) // 2
-        paste_y = banner_height + (1920 - banner_height - new_height) // 2
+def overlay_title_on_image(image_path, title, output_path, banner=None):
+    """정사각형 이미지에 제목 배너를 합성하고 1080x1920 비율로 변환
 
+    banner(render_title_banner 결과)를 넘기면 제목을 다시 그리지 않고 재사용합니다.
+    """
+    try:
+        # 원본 이미지 로드
+        image = Image.open(image_path)
+        banner_height = int(image.size[1] * 0.25)  # 상단 25% 영역
+        paste_y = banner_height + (CANVAS_SIZE[1] - banner_height - SCENE_IMAGE_SIZE[1]) // 2
+        if banner is None or banner.height != paste_y:
+            banner = render_title_banner(title, banner_height)
+
+        # 1080x1920 캔버스 생성 후 제목 배너 합성
+        final_image = Image.new("RGB", CANVAS_SIZE, "black")
+        final_image.paste(banner, (0, 0))
+
+        # 이미지 크기 조정 및 배치 (DALL·E 이미지는 이미 1024x1024이므로 리샘플링 생략)
+        image_resized = image if image.size == SCENE_IMAGE_SIZE else image.resize(SCENE_IMAGE_SIZE, Image.LANCZOS)
+        paste_x = (CANVAS_SIZE[0] - SCENE_IMAGE_SIZE[0]) // 2
         final_image.paste(image_resized, (paste_x, paste_y))
 
         # 최종 이미지 저장
@@ -341,47 +629,69 @@ def overlay_title_on_image(image_path, title, output_path):
         return False
 
 
-def generate_fast_tts(text, output_filename, speed=1.25):
-    """gTTS를 사용하여 TTS 생성 및 속도 조절"""
-    try:
-        # TTS 생성
-        tts = gTTS(text=text, lang='ko', tld="co.kr", slow=False)
-        fp = BytesIO()
-        tts.write_to_fp(fp)
-        fp.seek(0)
-
-        # 오디오 속도 조절
-        audio = AudioSegment.from_file(fp, format="mp3")
-        fast_audio = audio.speedup(
-            playback_speed=speed, chunk_size=150, crossfade=25)
-        fast_audio.export(output_filename, format="mp3")
-
-        logger.info(f"TTS 생성 완료: {output_filename}")
-        return True
+# TTS 재생 속도 - 속도 조절은 렌더링 시 ffmpeg atempo 필터로 적용 (최종 AAC 인코딩 1회)
+TTS_SPEED = 1.25
+
+
+def tempo_filter(speed=TTS_SPEED):
+    """ffmpeg 오디오 속도 조절 필터 (음높이 유지)"""
+    return f"atempo={speed}"
 
-    except Exception as e:
-        logger.error(f"[TTS 생성 오류] {e}")
-        return False
+
+def generate_tts_batch(texts, output_paths, item_context=None):
+    """설정된 TTS 백엔드로 여러 문장을 한 번에 생성 (캐시된 문장은 제외하고 요청)
+
+    :param item_context: i번째 문장의 캐시 조회/합성/저장을 감쌀 context 생성 함수 (씬별 측정용)
+    :return: 입력 순서대로 성공 여부 리스트
+    """
+    item_context = item_context or (lambda index: nullcontext())
+    backend = get_tts_backend()
+    cache_keys = [asset_cache.make_key(*backend.cache_params(), text) for text in texts]
+    results = []
+    for i, (cache_key, output_path) in enumerate(zip(cache_keys, output_paths)):
+        with item_context(i):
+            results.append(asset_cache.fetch("tts", cache_key, backend.extension, output_path))
+
+    missing = [i for i, cached in enumerate(results) if not cached]
+    if len(missing) < len(texts):
+        logger.info(f"[TTS 캐시 사용] {len(texts) - len(missing)}건")
+    if not missing:
+        return results
+
+    synthesized = backend.synthesize_batch(
+        [texts[i] for i in missing], [output_paths[i] for i in missing],
+        item_context=lambda index: item_context(missing[index]))
+    for i, success in zip(missing, synthesized):
+        if success:
+            with item_context(i):
+                asset_cache.put("tts", cache_keys[i], backend.extension, output_paths[i])
+            results[i] = True
+
+    logger.info(f"TTS 생성 완료 ({backend.name}): {sum(synthesized)}/{len(missing)}건")
+    return results
 
 
 def create_video_clip(image_file, audio_file, output_file):
-    """이미지와 오디오를 결합하여 비디오 클립 생성"""
-    # 기본값으로 직접 설정
-    audio_bitrate = '192k'
+    """이미지와 오디오를 결합하여 비디오 클립 생성
+
+    오디오는 속도 조절 후 무손실 PCM으로 담아두고(MKV), 최종 합성 시 한 번만 AAC로 인코딩합니다.
+    """
+    # 필터를 거친 오디오와 -shortest를 함께 쓰면 영상이 더 길게 인코딩되므로 이미지 길이를 직접 지정
+    duration = get_audio_duration(audio_file)
+    if duration is None:
+        return None
 
     command = [
         "ffmpeg", "-y",
-        "-loop", "1", "-i", image_file,
+        "-loop", "1", "-t", f"{duration / TTS_SPEED:.3f}", "-i", image_file,
         "-i", audio_file,
         "-map", "0:v:0",
         "-map", "1:a:0",
         "-c:v", "libx264",
         "-tune", "stillimage",
-        "-c:a", "aac",
-        "-b:a", audio_bitrate,
+        "-af", tempo_filter(),
+        "-c:a", "pcm_s16le",
         "-vf", "scale='iw-mod(iw,2)':'ih-mod(ih,2)',format=yuv420p",
-        "-shortest",
-        "-movflags", "+faststart",
         output_file
     ]
 
@@ -394,9 +704,9 @@ def create_video_clip(image_file, audio_file, output_file):
         return None
 
 
-def concatenate_video_clips(video_files, output_filename="final_video.mp4"):
+def concatenate_video_clips(video_files, output_filename, workspace):
     """여러 비디오 클립을 하나로 합치기"""
-    concat_list = get_temp_filepath("concat_list.txt")
+    concat_list = get_temp_filepath(workspace, "concat_list.txt")
 
     try:
         # concat 파일 생성
@@ -405,10 +715,11 @@ def concatenate_video_clips(video_files, output_filename="final_video.mp4"):
                 abs_path = os.path.abspath(video)
                 f.write(f"file '{abs_path}'\n")
 
-        # ffmpeg 실행
+        # ffmpeg 실행 (영상은 복사, PCM 오디오는 여기서 한 번만 AAC 인코딩)
         subprocess.run([
             "ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", concat_list,
-            "-c:v", "copy", "-c:a", "aac", output_filename
+            "-c:v", "copy", "-c:a", "aac", "-b:a", "192k",
+            "-movflags", "+faststart", output_filename
         ], check=True)
 
         # 임시 파일 삭제
@@ -422,18 +733,292 @@ def concatenate_video_clips(video_files, output_filename="final_video.mp4"):
         logger.error(f"[영상 합성 오류] {e}")
         return None
 
+def get_audio_duration(audio_file):
+    """ffprobe로 오디오 길이(초) 조회, 실패 시 None"""
+    try:
+        result = subprocess.run([
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            audio_file
+        ], check=True, capture_output=True, text=True)
+        return float(result.stdout.strip())
+    except (subprocess.CalledProcessError, ValueError) as e:
+        logger.error(f"[ffprobe 오류] {audio_file}: {e}")
+        return None
+
+
+def render_video_single_pass(image_files, audio_files, output_file, video_sink=None):
+    """모든 씬을 ffmpeg 한 번으로 최종 영상까지 렌더링
+
+    씬별 클립 인코딩 + concat 대신, 씬 이미지 N장을 각 오디오 길이만큼 보여주는 필터 그래프와
+    이어붙인 오디오 트랙 하나로 바로 인코딩합니다. (중간 MP4 없음, 오디오 AAC 인코딩 1회)
+
+    video_sink가 주어지면 파일로 저장하지 않고 ffmpeg stdout(fragmented MP4)을 video_sink(stream)에
+    넘기고, 그 반환값(예: S3 URL)을 반환합니다.
+    """
+    audio_bitrate = '192k'
+
+    durations = [get_audio_duration(audio_file) for audio_file in audio_files]
+    if not image_files or len(image_files) != len(audio_files) or None in durations:
+        logger.error("[단일 패스 렌더링] 씬 이미지/오디오 정보가 올바르지 않습니다.")
+        return None
+    # 오디오는 atempo로 빨라지므로 씬 길이도 같은 비율로 줄임
+    durations = [duration / TTS_SPEED for duration in durations]
+
+    scene_count = len(image_files)
+    command = ["ffmpeg", "-y"]
+    for image_file, duration in zip(image_files, durations):
+        command += ["-loop", "1", "-t", f"{duration:.3f}", "-i", image_file]
+    for audio_file in audio_files:
+        command += ["-i", audio_file]
+
+    # 씬별 영상/오디오 스트림 정규화 후 concat 필터로 연결
+    filters = []
+    concat_inputs = ""
+    for i in range(scene_count):
+        filters.append(
+            f"[{i}:v]scale='iw-mod(iw,2)':'ih-mod(ih,2)',format=yuv420p,setsar=1,fps=25[v{i}]")
+        filters.append(
+            f"[{scene_count + i}:a]{tempo_filter()},aresample=44100,"
+            f"aformat=sample_fmts=fltp:channel_layouts=mono[a{i}]")
+        concat_inputs += f"[v{i}][a{i}]"
+    filters.append(f"{concat_inputs}concat=n={scene_count}:v=1:a=1[v][a]")
+
+    command += [
+        "-filter_complex", ";".join(filters),
+        "-map", "[v]",
+        "-map", "[a]",
+        "-c:v", "libx264",
+        "-tune", "stillimage",
+        "-c:a", "aac",
+        "-b:a", audio_bitrate,
+    ]
+
+    if video_sink:
+        # 파이프 출력은 seek 할 수 없으므로 faststart 대신 fragmented MP4로 출력
+        command += ["-movflags", "frag_keyframe+empty_moov+default_base_moof", "-f", "mp4", "pipe:1"]
+        return stream_ffmpeg_output(command, video_sink)
+
+    command += ["-movflags", "+faststart", output_file]
+
+    try:
+        subprocess.run(command, check=True)
+        logger.info(f"[단일 패스 렌더링] {output_file} 생성 완료")
+        return output_file
+    except subprocess.CalledProcessError as e:
+        logger.error(f"[ffmpeg 오류] {e}")
+        return None
+
+
+def stream_ffmpeg_output(command, video_sink):
+    """ffmpeg stdout을 video_sink(stream)로 넘기고, ffmpeg가 정상 종료하면 video_sink의 반환값을 반환"""
+    process = subprocess.Popen(command, stdout=subprocess.PIPE)
+    try:
+        result = video_sink(process.stdout)
+    except Exception:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        process.stdout.close()
+
+    if process.wait() != 0:
+        logger.error(f"[ffmpeg 오류] 종료 코드 {process.returncode}")
+        return None
+    logger.info("[단일 패스 렌더링] 스트리밍 출력 완료")
+    return result
+
+
+def render_scene_clip(image_file, title, overlay_file, audio_file, output_file, banner=None):
+    """씬 1개의 오버레이 이미지 생성 + 영상 클립 인코딩 (프로세스 풀에서 실행되는 CPU 작업)
+
+    :return: (영상 클립 경로 또는 None, 단계별 측정값)
+    """
+    timer = StageTimer()
+    with timer.stage("overlay") as stage:
+        overlaid = overlay_title_on_image(image_file, title, overlay_file, banner)
+        stage["size"] = file_size(overlay_file) if overlaid else 0
+    if not overlaid:
+        return None, timer.stages
+
+    with timer.stage("encode") as stage:
+        clip = create_video_clip(overlay_file, audio_file, output_file)
+        stage["size"] = file_size(clip)
+    return clip, timer.stages
+
+
+# CPU 작업(PIL, ffmpeg)용 프로세스 풀 - 모든 작업이 공유하며 최초 사용 시 생성
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """코어 수에 맞춘 공유 프로세스 풀 반환"""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            # 워커 스레드가 도는 프로세스에서 fork 하면 lock 상태가 복사될 수 있으므로 spawn 사용
+            _render_pool = ProcessPoolExecutor(
+                max_workers=config["ENCODE_PROCESSES"],
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _render_pool
+
+
+def reset_render_pool(broken_pool: ProcessPoolExecutor):
+    """워커 프로세스가 비정상 종료(OOM 등)되어 깨진 풀 정리 → 다음 get_render_pool 호출 시 새로 생성"""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not broken_pool:
+            return  # 다른 작업에서 이미 새로 생성함
+        _render_pool = None
+    logger.warning("⚠️ 렌더링 프로세스 풀 손상 → 다음 작업부터 새 풀 사용")
+    broken_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def submit_scene_tasks(fn, scene_tasks):
+    """씬별 작업 [(scene_id, args), ...]를 공유 프로세스 풀에 제출 → (풀, [(scene_id, future), ...])
+
+    이전 작업에서 풀이 깨졌으면 새 풀을 만들어 한 번 다시 제출합니다.
+    """
+    pool = get_render_pool()
+    try:
+        return pool, [(scene_id, pool.submit(fn, *args)) for scene_id, args in scene_tasks]
+    except BrokenProcessPool:
+        reset_render_pool(pool)
+        pool = get_render_pool()
+        return pool, [(scene_id, pool.submit(fn, *args)) for scene_id, args in scene_tasks]
+
+
+def synthesize_scene_audio(scenes, scene_images, workspace):
+    """모든 씬의 TTS를 한 번에 생성 (원격 백엔드는 스레드 풀 동시 요청, 로컬 엔진은 모델 1회 로드 후 일괄 합성)
+
+    :return: [(scene_id, image_path, audio_path), ...] (씬 순서 유지, TTS 실패 씬 제외)
+    """
+    dialogues = {scene["scene"]: scene["dialogue"] for scene in scenes}
+    scene_images = [(scene_id, image_path) for scene_id, image_path in scene_images
+                    if scene_id in dialogues]
+    if not scene_images:
+        return []
+
+    extension = get_tts_backend().extension
+    audio_paths = [get_temp_filepath(workspace, f"scene_{scene_id}{extension}")
+                   for scene_id, _ in scene_images]
+
+    # 씬별 span: 캐시 조회 / 일괄 합성(스레드 풀) / 캐시 저장 구간을 씬마다 누적해 기록
+    trace = current_trace()
+    spans = [Span("tts", scene_id) for scene_id, _ in scene_images]
+    results = generate_tts_batch([dialogues[scene_id] for scene_id, _ in scene_images], audio_paths,
+                                 item_context=lambda index: trace.measure(spans[index]))
+    for span, audio_path, success in zip(spans, audio_paths, results):
+        if success:
+            span.add_file(audio_path)
+        trace.add(span)
+
+    return [(scene_id, image_path, audio_path)
+            for (scene_id, image_path), audio_path, success in zip(scene_images, audio_paths, results)
+            if success]
+
+
+def collect_scene_results(pool, futures, error_message):
+    """프로세스 풀 작업 결과를 제출 순서(씬 순서)대로 수집하고, 작업에서 측정한 단계별 시간을 trace에 기록
+
+    작업 중 워커 프로세스가 죽으면 해당 씬들만 실패 처리하고 풀은 다음 작업을 위해 새로 만듭니다.
+    """
+    trace = current_trace()
+    results = []
+    for scene_id, future in futures:
+        try:
+            result, stages = future.result()
+            for stage in stages:
+                trace.record(stage["stage"], stage["wall"], stage["cpu"], scene_id, stage["size"])
+        except BrokenProcessPool as e:
+            logger.error(f"[씬 렌더링 오류] 씬 {scene_id}: 워커 프로세스 비정상 종료 ({e})")
+            reset_render_pool(pool)
+            result = None
+        except Exception as e:
+            logger.error(f"[씬 렌더링 오류] 씬 {scene_id}: {e}")
+            result = None
+
+        if result:
+            results.append(result)
+        else:
+            logger.warning(f"씬 {scene_id}의 {error_message}")
+    return results
+
+
+def render_scene_clips(scenes, scene_images, title, workspace, banner=None):
+    """씬별 TTS → 오버레이/인코딩 단계를 동시에 실행
+
+    1단계: 모든 씬의 TTS를 스레드 풀에서 동시 생성 (네트워크 대기)
+    2단계: 오버레이 + 클립 인코딩을 프로세스 풀에서 동시 실행 (CPU 작업)
+
+    :return: 씬 순서가 유지된 영상 클립 경로 리스트
+    """
+    scene_assets = synthesize_scene_audio(scenes, scene_images, workspace)
+
+    pool, futures = submit_scene_tasks(render_scene_clip, [(scene_id, (
+        image_path,
+        title,
+        get_temp_filepath(workspace, f"scene_{scene_id}_overlay.{FRAME_FORMAT}"),
+        audio_path,
+        get_temp_filepath(workspace, f"scene_{scene_id}.mkv"),
+        banner,
+    )) for scene_id, image_path, audio_path in scene_assets])
+
+    return collect_scene_results(pool, futures, "영상 클립 생성 실패")
+
+
+def render_scene_frame(image_file, title, overlay_file, audio_file, banner=None):
+    """씬 1개의 오버레이 이미지 생성 (프로세스 풀에서 실행되는 CPU 작업)
+
+    :return: ((오버레이 경로, 오디오 경로) 또는 None, 단계별 측정값)
+    """
+    timer = StageTimer()
+    with timer.stage("overlay") as stage:
+        overlaid = overlay_title_on_image(image_file, title, overlay_file, banner)
+        stage["size"] = file_size(overlay_file) if overlaid else 0
+    return ((overlay_file, audio_file) if overlaid else None), timer.stages
+
+
+def render_scene_frames(scenes, scene_images, title, workspace, banner=None):
+    """단일 패스 렌더링용: 씬별 TTS(스레드 풀) → 오버레이 이미지(프로세스 풀)
+
+    :return: [(overlay_path, audio_path), ...] (씬 순서 유지)
+    """
+    scene_assets = synthesize_scene_audio(scenes, scene_images, workspace)
+
+    pool, futures = submit_scene_tasks(render_scene_frame, [(scene_id, (
+        image_path,
+        title,
+        get_temp_filepath(workspace, f"scene_{scene_id}_overlay.{FRAME_FORMAT}"),
+        audio_path,
+        banner,
+    )) for scene_id, image_path, audio_path in scene_assets])
+
+    return collect_scene_results(pool, futures, "오버레이 이미지 생성 실패")
+
 # ====================================
 # 전체 파이프라인 실행
 # ====================================
 
 
-def create_article(content, title):
-    """기사 내용으로부터 영상 생성 파이프라인 실행"""
-    # 초기화 - 임시 폴더 정리
-    cleanup_temp_files()
+def create_article(content, title, workspace=None, video_sink=None):
+    """기사 내용으로부터 영상 생성 파이프라인 실행
+
+    모든 중간/최종 파일은 실행별 작업 디렉토리(workspace)에 저장되며,
+    (최종 영상 경로, 썸네일 경로)를 반환합니다. workspace 삭제는 호출 측 책임입니다.
+    single_pass 모드에서 video_sink가 주어지면 최종 영상은 파일 대신 video_sink로 스트리밍되고,
+    영상 경로 자리에 video_sink의 반환값이 들어갑니다.
+    """
+    # 초기화 - 실행 전용 작업 디렉토리 준비
+    workspace = workspace or create_workspace()
+    trace = current_trace()
 
     # 1. 시나리오 생성
-    scenario_obj = generate_scenario(content, title)
+    with trace.span("scenario"):
+        scenario_obj = generate_scenario(content, title, workspace)
     if not scenario_obj or "scenes" not in scenario_obj:
         logger.error("시나리오 생성 실패")
         return None, None
@@ -441,21 +1026,11 @@ def create_article(content, title):
     overall_title = scenario_obj["title"]
     scenes = scenario_obj['scenes']
 
-    # 2. 각 씬별 이미지 생성
-    scene_images = []
-    successful_images = []
+    # 제목 배너는 기사마다 1회만 렌더링해 썸네일/모든 씬에 합성
+    banner = render_title_banner(overall_title)
 
-    for scene in scenes:
-        scene_id = scene["scene"]
-        dialogue = scene["dialogue"]
-
-        image_path = generate_image(dialogue, scene_id, successful_images)
-        if image_path:
-            scene_images.append((scene_id, image_path))
-            if image_path not in successful_images:
-                successful_images.append(image_path)
-        else:
-            logger.warning(f"씬 {scene_id}의 이미지 생성 실패 및 대체 이미지도 없음")
+    # 2. 각 씬별 이미지 생성 (동시 요청)
+    scene_images = generate_scene_images(scenes, workspace)
 
     # 3. 썸네일 이미지 생성
     thumbnail_path = None
@@ -471,59 +1046,55 @@ def create_article(content, title):
             first_scene = next(
                 (img for id, img in scene_images if id == first_scene_id), None)
             if first_scene:
-                # 오버레이 이미지 생성
-                first_overlay_path = get_temp_filepath("thumbnail_overlay.png")
-                if overlay_title_on_image(first_scene, overall_title, first_overlay_path):
-                    # 생성된 오버레이 이미지를 썸네일로 사용
-                    thumbnail_path = os.path.join(OUTPUT_DIR, "thumbnail.png")
-                    try:
-                        # 오버레이 이미지를 썸네일 경로로 복사
-                        shutil.copy(first_overlay_path, thumbnail_path)
-                        logger.info(f"썸네일 이미지 저장 완료: {thumbnail_path}")
-                    except Exception as e:
-                        logger.error(f"썸네일 복사 중 오류: {e}")
-                        thumbnail_path = None
+                # 오버레이 이미지를 썸네일 경로에 바로 생성 (썸네일만 PNG로 저장)
+                first_overlay_path = get_output_filepath(
+                    workspace, "thumbnail.png")
+                with trace.span("thumbnail") as span:
+                    overlaid = overlay_title_on_image(first_scene, overall_title, first_overlay_path, banner)
+                    span.add_file(first_overlay_path if overlaid else None)
+                if overlaid:
+                    thumbnail_path = first_overlay_path
+                    logger.info(f"썸네일 이미지 저장 완료: {thumbnail_path}")
                 else:
                     logger.error("썸네일 오버레이 생성 실패")
                     # 실패 시에만 thumbnail_path를 None으로 설정 (중복된 None 할당 제거)
 
-    # 4. 각 씬별 영상 클립 생성
-    video_clips = []
-    for scene_id, image_path in scene_images:
-        scene_data = next((s for s in scenes if s["scene"] == scene_id), None)
-        if not scene_data:
-            continue
-
-        dialogue = scene_data["dialogue"]
-
-        # 오버레이 이미지 생성
-        overlay_img_path = get_temp_filepath(f"scene_{scene_id}_overlay.png")
-        if not overlay_title_on_image(image_path, overall_title, overlay_img_path):
-            continue
-
-        audio_path = get_temp_filepath(f"scene_{scene_id}_fast.mp3")
-        if not generate_fast_tts(dialogue, audio_path, speed=1.25):
-            continue
-
-        # 비디오 클립 생성
-        output_video = get_temp_filepath(f"scene_{scene_id}.mp4")
-        video_clip = create_video_clip(
-            overlay_img_path, audio_path, output_video)
-        if video_clip:
-            video_clips.append(video_clip)
+    final_video_path = None
+    output_video = get_output_filepath(workspace, "final_video.mp4")
+
+    if config["RENDER_MODE"] == "single_pass":
+        # 4. 각 씬별 TTS + 오버레이 이미지 생성
+        scene_frames = render_scene_frames(
+            scenes, scene_images, overall_title, workspace, banner)
+
+        # 5. ffmpeg 한 번으로 최종 영상 렌더링
+        if scene_frames:
+            overlay_paths, audio_paths = zip(*scene_frames)
+            with trace.span("encode") as span:
+                final_video_path = render_video_single_pass(
+                    list(overlay_paths), list(audio_paths), output_video, video_sink)
+                if not video_sink:
+                    span.add_file(final_video_path)
+        else:
+            logger.error("씬 이미지/오디오 생성 실패")
+    else:
+        # 4. 각 씬별 영상 클립 생성 (TTS 스레드 풀 → 오버레이/인코딩 프로세스 풀)
+        video_clips = render_scene_clips(
+            scenes, scene_images, overall_title, workspace, banner)
+
+        # 5. 모든 클립을 하나의 영상으로 합성
+        if video_clips:
+            with trace.span("concat") as span:
+                final_video_path = concatenate_video_clips(
+                    video_clips, output_video, workspace)
+                span.add_file(final_video_path)
         else:
-            logger.warning(f"씬 {scene_id}의 영상 클립 생성 실패")
+            logger.error("영상 클립 생성 실패")
 
-    # 5. 모든 클립을 하나의 영상으로 합성
-    final_video_path = None
-    if video_clips:
-        final_video_path = os.path.join(OUTPUT_DIR, "final_video.mp4")
-        concatenate_video_clips(video_clips, final_video_path)
+    if final_video_path:
         logger.info(f"최종 영상 생성 완료: {final_video_path}")
-    else:
-        logger.error("영상 클립 생성 실패")
 
-    # 6. 정리 작업
-    cleanup_temp_files()
+    # 6. 정리 작업 (최종 결과물은 남기고 임시 파일만 삭제)
+    cleanup_temp_files(workspace)
 
     return final_video_path, thumbnail_path
@@ -1,5 +1,14 @@
+import base64
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from config import logger, config
+from monitoring.tracing import record_bytes
 
 # AWS config: 환경변수에서 읽어온 값 사용
 AWS_ACCESS_KEY = config["AWS_ACCESS_KEY_ID"]
@@ -7,18 +16,115 @@ AWS_SECRET_KEY = config["AWS_SECRET_ACCESS_KEY"]
 AWS_REGION_NAME = config["AWS_REGION"]
 AWS_BUCKET_NAME = config["AWS_BUCKET_NAME"]
 
-# S3 Client 생성
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=AWS_ACCESS_KEY,
-    aws_secret_access_key=AWS_SECRET_KEY,
-    region_name=AWS_REGION_NAME
+# 업로드된 파일의 공개 URL (CloudFront)
+PUBLIC_URL_BASE = config["S3_PUBLIC_URL_BASE"]
+
+# 멀티파트 업로드 설정 (파트 크기, 동시 업로드 수)
+MB = 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=config["S3_MULTIPART_THRESHOLD_MB"] * MB,
+    multipart_chunksize=config["S3_MULTIPART_CHUNK_MB"] * MB,
+    max_concurrency=config["S3_MAX_CONCURRENCY"],
+    use_threads=True,
 )
 
+# S3 Client 생성 (S3_ENDPOINT_URL 설정 시 MinIO/moto 등 로컬 S3 사용)
+# 클라이언트 생성 비용이 커서 최초 업로드 시 1회만 생성
+@lru_cache(maxsize=None)
+def get_s3_client():
+    return boto3.client(
+        "s3",
+        aws_access_key_id=AWS_ACCESS_KEY,
+        aws_secret_access_key=AWS_SECRET_KEY,
+        region_name=AWS_REGION_NAME,
+        endpoint_url=config["S3_ENDPOINT_URL"],
+        config=Config(
+            retries={"max_attempts": config["S3_MAX_ATTEMPTS"], "mode": "adaptive"},
+            # 동시 작업 수(RENDER_WORKERS) × 파일 2개 × 파트 동시 업로드 수만큼 커넥션 필요
+            max_pool_connections=config["RENDER_WORKERS"] * 2 * config["S3_MAX_CONCURRENCY"],
+        ),
+    )
+
+
+class ChecksumReader:
+    """읽은 데이터의 SHA256을 전체/파트 단위로 계산하는 스트림 래퍼 (스트리밍 업로드 검증용)"""
+
+    def __init__(self, stream, part_size: int):
+        self._stream = stream
+        self._part_size = part_size
+        self._part = hashlib.sha256()
+        self._part_bytes = 0
+        self.full = hashlib.sha256()
+        self.part_digests = []
+        self.size = 0
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self.full.update(data)
+        self.size += len(data)
+
+        view = memoryview(data)
+        while view:
+            chunk = view[:self._part_size - self._part_bytes]
+            self._part.update(chunk)
+            self._part_bytes += len(chunk)
+            view = view[len(chunk):]
+            if self._part_bytes == self._part_size:
+                self._close_part()
+        return data
+
+    def _close_part(self):
+        self.part_digests.append(self._part.digest())
+        self._part = hashlib.sha256()
+        self._part_bytes = 0
+
+    def finish(self):
+        if self._part_bytes:
+            self._close_part()
+        return self
+
+
+def _read_file_checksums(file_path: str, part_size: int) -> ChecksumReader:
+    """로컬 파일의 SHA256 (전체 + 파트별) 계산"""
+    with open(file_path, "rb") as file_data:
+        reader = ChecksumReader(file_data, part_size)
+        while reader.read(part_size):
+            pass
+    return reader.finish()
+
+
+def _verify_upload(s3_key: str, checksums: ChecksumReader):
+    """업로드된 객체의 크기와 SHA256 체크섬을 로컬 값과 비교"""
+    head = get_s3_client().head_object(Bucket=AWS_BUCKET_NAME, Key=s3_key, ChecksumMode="ENABLED")
+    if head["ContentLength"] != checksums.size:
+        raise ValueError(f"크기 불일치: local={checksums.size}, s3={head['ContentLength']}")
+
+    remote = head.get("ChecksumSHA256")
+    if not remote:
+        logger.warning(f"⚠️ S3 체크섬 정보 없음 (크기만 검증): {s3_key}")
+        return
+
+    # 단일 업로드는 전체 체크섬, 멀티파트 업로드는 파트별 체크섬을 이어붙인 값의 체크섬 (+ "-파트 수")
+    full = base64.b64encode(checksums.full.digest()).decode()
+    composite = base64.b64encode(hashlib.sha256(b"".join(checksums.part_digests)).digest()).decode()
+    if remote.split("-")[0] not in (full, composite):
+        raise ValueError(f"체크섬 불일치: local={full}, s3={remote}")
+
+
+def _upload_fileobj(fileobj, s3_key: str, content_type: str):
+    get_s3_client().upload_fileobj(
+        fileobj,
+        AWS_BUCKET_NAME,
+        s3_key,
+        ExtraArgs={"ContentType": content_type, "ChecksumAlgorithm": "SHA256"},
+        Config=TRANSFER_CONFIG,
+    )
+
+
 # ✅ S3 업로드 함수
 def upload_to_s3(file_path: str, s3_key: str, content_type: str) -> str:
     """
-    파일을 S3에 업로드하고 URL을 반환하는 함수
+    파일을 S3에 업로드하고 URL을 반환하는 함수 (큰 파일은 멀티파트로 병렬 업로드)
 
     :param file_path: 로컬 파일 경로
     :param s3_key: S3 내 저장될 파일 경로
@@ -27,16 +133,48 @@ def upload_to_s3(file_path: str, s3_key: str, content_type: str) -> str:
     """
     try:
         with open(file_path, "rb") as file_data:
-            s3_client.upload_fileobj(
-                file_data,
-                AWS_BUCKET_NAME,
-                s3_key,
-                ExtraArgs={"ContentType": content_type}
-            )
-        file_url = f"https://d1khc6c0zhbaeh.cloudfront.net/{s3_key}"
+            _upload_fileobj(file_data, s3_key, content_type)
+        _verify_upload(s3_key, _read_file_checksums(file_path, TRANSFER_CONFIG.multipart_chunksize))
+
+        file_url = f"{PUBLIC_URL_BASE}/{s3_key}"
         # file_url = f"https://{AWS_BUCKET_NAME}.s3.{AWS_REGION_NAME}.amazonaws.com/{s3_key}"
-        logger.info(f"✅ S3 업로드 완료: {file_url}")
+        logger.info(f"✅ S3 업로드 완료: {file_url} ({os.path.getsize(file_path)} bytes)")
         return file_url
     except Exception as e:
         logger.error(f"❌ S3 업로드 실패: {e}")
         raise Exception(f"S3 업로드 오류: {e}")
+
+
+# ✅ S3 스트리밍 업로드 함수
+def upload_stream_to_s3(stream, s3_key: str, content_type: str) -> str:
+    """
+    파일로 저장하지 않고 스트림(ffmpeg stdout 등)을 읽는 대로 멀티파트 업로드
+
+    :param stream: read()를 지원하는 바이너리 스트림 (seek 불필요)
+    :return: S3에 업로드된 파일의 URL
+    """
+    try:
+        # 스트림은 다시 읽을 수 없으므로 업로드하면서 체크섬 계산
+        reader = ChecksumReader(stream, TRANSFER_CONFIG.multipart_chunksize)
+        _upload_fileobj(reader, s3_key, content_type)
+        _verify_upload(s3_key, reader.finish())
+        record_bytes(reader.size)
+
+        file_url = f"{PUBLIC_URL_BASE}/{s3_key}"
+        logger.info(f"✅ S3 스트리밍 업로드 완료: {file_url} ({reader.size} bytes)")
+        return file_url
+    except Exception as e:
+        logger.error(f"❌ S3 스트리밍 업로드 실패: {e}")
+        raise Exception(f"S3 업로드 오류: {e}")
+
+
+# ✅ 여러 파일 동시 업로드
+def upload_files_to_s3(uploads) -> list:
+    """
+    (file_path, s3_key, content_type) 목록을 동시에 업로드
+
+    :return: 입력 순서대로 S3 URL 리스트
+    """
+    with ThreadPoolExecutor(max_workers=max(1, len(uploads)), thread_name_prefix="s3-upload") as executor:
+        futures = [executor.submit(upload_to_s3, *upload) for upload in uploads]
+        return [future.result() for future in futures]
@@ -0,0 +1,88 @@
+"""✅ 크롤러 HTML 추출기 벤치마크
+
+저장해 둔 네이버 기사/헤드라인 페이지로 추출기별 파싱 시간과 메모리를 비교하고,
+lxml 추출기 결과가 BeautifulSoup 추출기 결과와 같은지 확인합니다.
+
+    # 페이지 저장 (fixture 생성)
+    python benchmark_extractor.py --save https://n.news.naver.com/mnews/article/... --dir fixtures/html
+    # 벤치마크 실행 (경로를 생략하면 fixtures/html/*.html 사용)
+    python benchmark_extractor.py
+"""
+import argparse
+import glob
+import hashlib
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from lambda_function import EXTRACTORS, HEADLINE_LIMIT, etree, fetch
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "html")
+
+
+def save_fixtures(urls, directory):
+    os.makedirs(directory, exist_ok=True)
+    for url in urls:
+        path = os.path.join(directory, f"{hashlib.sha1(url.encode()).hexdigest()[:12]}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(fetch(url).text)
+        print(f"💾 {url} → {path}")
+
+
+def extract(extractor, html):
+    return extractor.extract_article(html), extractor.extract_headlines(html, HEADLINE_LIMIT)
+
+
+def measure(extractor, html, repeat):
+    """(평균 시간(ms), 최대 메모리(KB, Python 할당 기준)) 반환"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(extractor, html)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    extract(extractor, html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.mean(timings), peak / 1024
+
+
+def run_benchmark(paths, repeat):
+    names = [name for name in EXTRACTORS if name != "lxml" or etree is not None]
+    mismatches = 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+
+        # 정확성: 모든 추출기 결과가 BeautifulSoup 결과와 같아야 함
+        expected = extract(EXTRACTORS["bs4"], html)
+        for name in names:
+            if extract(EXTRACTORS[name], html) != expected:
+                mismatches += 1
+                print(f"❌ 결과 불일치: {path} ({name})")
+
+        results = ", ".join(
+            f"{name} {ms:.2f}ms / {kb:.0f}KB" for name, (ms, kb) in
+            ((name, measure(EXTRACTORS[name], html, repeat)) for name in names))
+        print(f"{os.path.basename(path)} ({len(html) // 1024}KB): {results}")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤러 HTML 추출기 벤치마크")
+    parser.add_argument("paths", nargs="*", help="저장된 HTML 파일 (생략 시 --dir의 *.html, --save 시 URL)")
+    parser.add_argument("--save", action="store_true", help="paths의 URL을 fixture로 저장")
+    parser.add_argument("--dir", default=FIXTURE_DIR, help="fixture 디렉토리")
+    parser.add_argument("--repeat", type=int, default=20, help="파일당 반복 횟수")
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixtures(args.paths, args.dir)
+    else:
+        paths = args.paths or sorted(glob.glob(os.path.join(args.dir, "*.html")))
+        if not paths:
+            sys.exit(f"❌ 벤치마크할 HTML 파일이 없습니다: {args.dir}")
+        sys.exit(1 if run_benchmark(paths, args.repeat) else 0)
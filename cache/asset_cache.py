@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Optional
+
+from config import logger, config
+from monitoring.tracing import record_cache
+
+
+class AssetCache:
+    """✅ 생성 결과물(이미지, TTS 오디오, 시나리오) 디스크 캐시
+
+    - 입력값 해시를 키로 사용하는 content-addressed 저장소
+    - 전체 용량이 max_bytes를 넘으면 가장 오래 사용되지 않은 파일부터 삭제 (LRU)
+    - namespace별 hit/miss 카운터 제공
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = defaultdict(int)
+        self._misses = defaultdict(int)
+        self._total_bytes = None  # 최초 사용 시 디렉터리를 스캔해 계산 (import 시점 지연 방지)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """입력값들을 하나의 sha256 키로 변환"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _ensure_total_bytes(self):
+        """현재 캐시 용량 계산 (lock 안에서 호출, 최초 1회만 스캔 - 저장 중인 임시 파일 제외)"""
+        if self._total_bytes is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._total_bytes = sum(size for path, size, _ in self._scan() if not path.endswith(".tmp"))
+
+    def _path(self, namespace: str, key: str, ext: str) -> str:
+        return os.path.join(self.directory, namespace, key[:2], f"{key}{ext}")
+
+    def _scan(self):
+        """캐시 파일 목록 (경로, 크기, 마지막 사용 시각)"""
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def get(self, namespace: str, key: str, ext: str = "") -> Optional[str]:
+        """캐시된 파일 경로 반환 (없으면 None)"""
+        path = self._path(namespace, key, ext)
+        try:
+            os.utime(path)  # 사용 시각 갱신 (LRU)
+        except FileNotFoundError:
+            with self._lock:
+                self._misses[namespace] += 1
+            record_cache(namespace, False)
+            return None
+
+        with self._lock:
+            self._hits[namespace] += 1
+        record_cache(namespace, True)
+        return path
+
+    def put(self, namespace: str, key: str, ext: str, source_path: str) -> str:
+        """파일을 캐시에 복사 (같은 키가 동시에 저장되어도 안전하도록 임시 파일 → rename)"""
+        path = self._path(namespace, key, ext)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(source_path, tmp_path)
+            size = os.path.getsize(tmp_path)
+
+            # 용량 계산(최초 스캔 포함) → 교체 → 반영을 한 lock 안에서 처리 (같은 키 동시 저장 시에도 정확)
+            with self._lock:
+                self._ensure_total_bytes()
+                replaced = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(tmp_path, path)
+                self._total_bytes += size - replaced
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
+
+    def fetch(self, namespace: str, key: str, ext: str, output_path: str) -> bool:
+        """캐시 히트 시 output_path로 복사하고 True 반환"""
+        cached_path = self.get(namespace, key, ext)
+        if not cached_path:
+            return False
+        try:
+            shutil.copyfile(cached_path, output_path)
+            return True
+        except FileNotFoundError:
+            # 조회 직후 다른 작업이 삭제한 경우
+            return False
+
+    def get_json(self, namespace: str, key: str):
+        cached_path = self.get(namespace, key, ".json")
+        if not cached_path:
+            return None
+        try:
+            with open(cached_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put_json(self, namespace: str, key: str, value) -> str:
+        fd, tmp_path = tempfile.mkstemp(suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            return self.put(namespace, key, ".json", tmp_path)
+        finally:
+            os.remove(tmp_path)
+
+    def _evict(self):
+        """가장 오래 사용되지 않은 파일부터 삭제 (lock 안에서 호출)"""
+        target = int(self.max_bytes * 0.9)  # 매번 evict 되지 않도록 여유 확보
+        for path, size, _ in sorted(self._scan(), key=lambda entry: entry[2]):
+            if self._total_bytes <= target:
+                break
+            if path.endswith(".tmp"):
+                continue
+            try:
+                os.remove(path)
+                self._total_bytes -= size
+            except FileNotFoundError:
+                continue
+        logger.info(f"[캐시 정리] 현재 용량: {self._total_bytes / 1024 / 1024:.1f}MB")
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._ensure_total_bytes()
+            namespaces = set(self._hits) | set(self._misses)
+            return {
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "namespaces": {
+                    namespace: {"hits": self._hits[namespace], "misses": self._misses[namespace]}
+                    for namespace in sorted(namespaces)
+                },
+            }
+
+
+# 전역 캐시 인스턴스
+asset_cache = AssetCache(
+    config["ASSET_CACHE_DIR"], config["ASSET_CACHE_MAX_MB"] * 1024 * 1024)
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+import orjson
+from email.utils import formatdate
+from typing import Any, Awaitable, Callable, Optional
+
+from config import logger, config
+
+
+class LocalCacheBackend:
+    """✅ 프로세스 내 TTL + LRU 캐시 (기본 백엔드, 공유 백엔드의 로컬 대체용)"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: Optional[float] = None):
+        with self._lock:
+            expires_at = time.monotonic() + ttl if ttl else None
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # 메모리 조회라 이벤트 루프를 막지 않으므로 동기 메서드를 그대로 사용
+    async def aget(self, key: str):
+        return self.get(key)
+
+    async def aset(self, key: str, value, ttl: Optional[float] = None):
+        self.set(key, value, ttl)
+
+
+class RedisCacheBackend:
+    """✅ 여러 서버 프로세스가 공유하는 Redis 백엔드 (redis 패키지 필요)
+
+    비동기 조회 API는 redis.asyncio 클라이언트로 이벤트 루프를 막지 않고 조회하고,
+    워커 스레드(게시 후 무효화)에서는 동기 클라이언트를 사용합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "bitenews:"):
+        import redis  # 공유 백엔드를 사용할 때만 필요
+        import redis.asyncio
+
+        self._client = redis.Redis.from_url(url)
+        self._async_client = redis.asyncio.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str):
+        value = self._client.get(self._prefix + key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value, ttl: Optional[float] = None):
+        self._client.set(self._prefix + key, json.dumps(value, ensure_ascii=False),
+                         ex=int(ttl) if ttl else None)
+
+    async def aget(self, key: str):
+        value = await self._async_client.get(self._prefix + key)
+        return json.loads(value) if value is not None else None
+
+    async def aset(self, key: str, value, ttl: Optional[float] = None):
+        await self._async_client.set(self._prefix + key, json.dumps(value, ensure_ascii=False),
+                                     ex=int(ttl) if ttl else None)
+
+
+class ResponseCache:
+    """✅ 조회 API 응답 캐시
+
+    - 기사가 게시(video_url 업데이트)되면 invalidate()로 세대(generation)를 올려 이전 캐시를 모두 무효화
+    - 캐시 항목마다 ETag / Last-Modified 값을 함께 저장
+    - 세대 값은 generation_ttl초 동안 프로세스 안에 보관 (요청마다 공유 백엔드를 한 번 더 조회하지 않음,
+      다른 프로세스의 무효화는 최대 generation_ttl초 늦게 반영)
+    """
+
+    GENERATION_KEY = "response-cache:generation"
+
+    def __init__(self, backend, ttl: float = 30, generation_ttl: float = 1):
+        self.backend = backend
+        self.ttl = ttl
+        self.generation_ttl = generation_ttl
+        self._local_generation = None  # (세대, 조회 시각)
+
+    def _cached_generation(self) -> Optional[float]:
+        cached = self._local_generation
+        if cached is not None and time.monotonic() - cached[1] < self.generation_ttl:
+            return cached[0]
+        return None
+
+    def _remember_generation(self, generation: float) -> float:
+        self._local_generation = (generation, time.monotonic())
+        return generation
+
+    def _fallback_generation(self, error: Exception) -> float:
+        """공유 백엔드 장애 시 프로세스 로컬 세대 사용 (마지막으로 알던 값, 없으면 지금 시각)
+
+        장애 중에는 항목 조회도 실패하므로 캐시 미스로 처리되어 loader가 실행됩니다.
+        """
+        logger.error(f"[응답 캐시 세대 조회 오류] {error}")
+        cached = self._local_generation
+        return self._remember_generation(cached[0] if cached is not None else time.time())
+
+    def _generation(self) -> float:
+        """현재 세대 = 마지막 게시 시각 (없으면 지금 시각으로 초기화)"""
+        generation = self._cached_generation()
+        if generation is not None:
+            return generation
+
+        try:
+            generation = self.backend.get(self.GENERATION_KEY)
+            if generation is None:
+                generation = time.time()
+                self.backend.set(self.GENERATION_KEY, generation)
+        except Exception as e:
+            return self._fallback_generation(e)
+        return self._remember_generation(generation)
+
+    async def _ageneration(self) -> float:
+        """_generation의 비동기 버전"""
+        generation = self._cached_generation()
+        if generation is not None:
+            return generation
+
+        try:
+            generation = await self.backend.aget(self.GENERATION_KEY)
+            if generation is None:
+                generation = time.time()
+                await self.backend.aset(self.GENERATION_KEY, generation)
+        except Exception as e:
+            return self._fallback_generation(e)
+        return self._remember_generation(generation)
+
+    def invalidate(self):
+        """기사 게시 시 호출: 모든 조회 응답 캐시 무효화
+
+        게시는 이미 끝난 상태이므로 공유 백엔드 장애로 실패해도 예외를 올리지 않습니다.
+        (이 프로세스는 즉시, 다른 프로세스는 캐시 TTL이 지나면 새 기사 반영)
+        """
+        generation = self._remember_generation(time.time())
+        try:
+            self.backend.set(self.GENERATION_KEY, generation)
+            logger.info("[응답 캐시 무효화]")
+        except Exception as e:
+            logger.error(f"[응답 캐시 무효화 오류] {e}")
+
+    def _key(self, namespace: str, params: dict, generation: float) -> str:
+        return f"{namespace}:{generation}:{json.dumps(params, sort_keys=True)}"
+
+    @staticmethod
+    def _entry(generation: float, data) -> dict:
+        body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        return {
+            "data": data,
+            "etag": f'"{hashlib.sha1(body).hexdigest()}"',
+            "last_modified": formatdate(generation, usegmt=True),
+        }
+
+    def get_or_load(self, namespace: str, params: dict, loader: Callable[[], Any]) -> dict:
+        """캐시된 응답 반환, 없으면 loader() 실행 후 저장
+
+        :return: {"data": ..., "etag": ..., "last_modified": ...}
+        """
+        generation = self._generation()
+        key = self._key(namespace, params, generation)
+        try:
+            entry = self.backend.get(key)
+        except Exception as e:
+            # 공유 백엔드 장애 시에도 조회 API는 계속 동작해야 함
+            logger.error(f"[응답 캐시 조회 오류] {e}")
+            entry = None
+        if entry is not None:
+            return entry
+
+        entry = self._entry(generation, loader())
+        try:
+            self.backend.set(key, entry, self.ttl)
+        except Exception as e:
+            logger.error(f"[응답 캐시 저장 오류] {e}")
+        return entry
+
+    async def aget_or_load(self, namespace: str, params: dict, loader: Callable[[], Awaitable[Any]]) -> dict:
+        """get_or_load의 비동기 버전 (loader는 coroutine 함수, 백엔드도 비동기로 조회)"""
+        generation = await self._ageneration()
+        key = self._key(namespace, params, generation)
+        try:
+            entry = await self.backend.aget(key)
+        except Exception as e:
+            logger.error(f"[응답 캐시 조회 오류] {e}")
+            entry = None
+        if entry is not None:
+            return entry
+
+        entry = self._entry(generation, await loader())
+        try:
+            await self.backend.aset(key, entry, self.ttl)
+        except Exception as e:
+            logger.error(f"[응답 캐시 저장 오류] {e}")
+        return entry
+
+
+def create_response_cache() -> ResponseCache:
+    """설정에 따라 공유(Redis) 또는 로컬 백엔드로 응답 캐시 생성"""
+    if config["RESPONSE_CACHE_REDIS_URL"]:
+        backend = RedisCacheBackend(config["RESPONSE_CACHE_REDIS_URL"])
+    else:
+        backend = LocalCacheBackend(config["RESPONSE_CACHE_MAX_ENTRIES"])
+    return ResponseCache(backend, ttl=config["RESPONSE_CACHE_TTL"],
+                         generation_ttl=config["RESPONSE_CACHE_GENERATION_TTL"])
+
+
+# 전역 응답 캐시 인스턴스
+response_cache = create_response_cache()
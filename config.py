@@ -25,6 +25,44 @@ missing = [key for key in required_keys if config.get(key) is None]
 if missing:
     raise EnvironmentError(f"다음 환경변수가 설정되지 않았습니다: {', '.join(missing)}")
 
+# 선택 환경변수 (설정하지 않으면 기본값 사용)
+config.update({
+    "RENDER_WORKERS": int(os.environ.get("RENDER_WORKERS", 2)),  # 동시에 처리할 영상 생성 작업 수
+    "IMAGE_CONCURRENCY": int(os.environ.get("IMAGE_CONCURRENCY", 4)),  # 기사 1건당 동시 DALL·E 요청 수
+    "TTS_CONCURRENCY": int(os.environ.get("TTS_CONCURRENCY", 4)),  # 기사 1건당 동시 TTS 요청 수
+    "RENDER_MODE": os.environ.get("RENDER_MODE", "single_pass"),  # single_pass: ffmpeg 1회 렌더링, clips: 씬별 클립 + concat
+    "ASSET_CACHE_DIR": os.environ.get("ASSET_CACHE_DIR", os.path.join("output", "cache")),  # 생성 결과물 캐시 경로
+    "ASSET_CACHE_MAX_MB": int(os.environ.get("ASSET_CACHE_MAX_MB", 2048)),  # 캐시 최대 용량 (초과 시 LRU 삭제)
+    "RESPONSE_CACHE_TTL": int(os.environ.get("RESPONSE_CACHE_TTL", 30)),  # 조회 API 응답 캐시 유지 시간(초)
+    "RESPONSE_CACHE_MAX_ENTRIES": int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", 1024)),  # 로컬 응답 캐시 최대 항목 수
+    "RESPONSE_CACHE_REDIS_URL": os.environ.get("RESPONSE_CACHE_REDIS_URL"),  # 설정 시 Redis를 공유 응답 캐시로 사용
+    "RESPONSE_CACHE_GENERATION_TTL": float(os.environ.get("RESPONSE_CACHE_GENERATION_TTL", 1)),  # 캐시 세대 값 로컬 보관 시간(초) - 다른 서버의 무효화 반영 지연
+    "DB_POOL_SIZE": int(os.environ.get("DB_POOL_SIZE", 10)),  # DB 커넥션 풀 기본 크기
+    "DB_MAX_OVERFLOW": int(os.environ.get("DB_MAX_OVERFLOW", 10)),  # 풀 크기 초과 시 추가로 허용할 커넥션 수
+    "DB_POOL_TIMEOUT": int(os.environ.get("DB_POOL_TIMEOUT", 30)),  # 커넥션을 얻기 위한 최대 대기 시간(초)
+    "DB_POOL_RECYCLE": int(os.environ.get("DB_POOL_RECYCLE", 1800)),  # 커넥션 재생성 주기(초)
+    "DB_POOL_PRE_PING": os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true",  # 사용 전 커넥션 상태 확인
+    "S3_ENDPOINT_URL": os.environ.get("S3_ENDPOINT_URL"),  # MinIO/moto 등 로컬 S3 사용 시 설정
+    "S3_PUBLIC_URL_BASE": os.environ.get("S3_PUBLIC_URL_BASE", "https://d1khc6c0zhbaeh.cloudfront.net"),  # 업로드 파일 공개 URL
+    "S3_MULTIPART_THRESHOLD_MB": int(os.environ.get("S3_MULTIPART_THRESHOLD_MB", 8)),  # 이 크기 이상은 멀티파트 업로드
+    "S3_MULTIPART_CHUNK_MB": int(os.environ.get("S3_MULTIPART_CHUNK_MB", 8)),  # 멀티파트 파트 크기 (최소 5MB)
+    "S3_MAX_CONCURRENCY": int(os.environ.get("S3_MAX_CONCURRENCY", 8)),  # 파일당 동시 파트 업로드 수
+    "S3_MAX_ATTEMPTS": int(os.environ.get("S3_MAX_ATTEMPTS", 5)),  # S3 요청 재시도 횟수
+    "S3_STREAM_UPLOAD": os.environ.get("S3_STREAM_UPLOAD", "false").lower() == "true",  # ffmpeg 출력을 파일 없이 바로 업로드
+    "DB_AUTO_MIGRATE": os.environ.get("DB_AUTO_MIGRATE", "true").lower() == "true",  # 서버 시작 시 테이블 생성/스키마 보정
+    "ENCODE_PROCESSES": int(os.environ.get("ENCODE_PROCESSES", os.cpu_count() or 1)),  # 오버레이/인코딩 프로세스 수
+    "PROFILE_RENDER": os.environ.get("PROFILE_RENDER", "false").lower() == "true",  # 모든 영상 생성 작업 프로파일링
+    "PROFILER": os.environ.get("PROFILER", "cprofile"),  # cprofile 또는 pyinstrument (별도 설치 필요)
+    "PROFILE_DIR": os.environ.get("PROFILE_DIR", os.path.join("output", "profiles")),  # 프로파일 저장 경로
+    "FRAME_FORMAT": os.environ.get("FRAME_FORMAT", "bmp"),  # 씬 오버레이 중간 파일 포맷 (bmp: 빠름, png: 작음)
+    "TTS_BACKEND": os.environ.get("TTS_BACKEND", "gtts"),  # gtts / openai / melo (로컬 CPU 엔진, 별도 설치 필요)
+    "TTS_MAX_ATTEMPTS": int(os.environ.get("TTS_MAX_ATTEMPTS", 3)),  # 원격 TTS 요청 재시도 횟수
+    "OPENAI_TTS_MODEL": os.environ.get("OPENAI_TTS_MODEL", "tts-1"),  # TTS_BACKEND=openai 사용 시 모델
+    "OPENAI_TTS_VOICE": os.environ.get("OPENAI_TTS_VOICE", "alloy"),  # TTS_BACKEND=openai 사용 시 목소리
+    "SCENARIO_MAX_INPUT_TOKENS": int(os.environ.get("SCENARIO_MAX_INPUT_TOKENS", 3000)),  # 시나리오 생성 시 기사 본문 최대 토큰 수
+    "SCENARIO_MAX_ATTEMPTS": int(os.environ.get("SCENARIO_MAX_ATTEMPTS", 3)),  # 시나리오 생성 재시도 횟수
+})
+
 # 로그 설정
 log_format = '%(levelname)s: %(asctime)s - %(name)s - %(message)s'
 logger = logging.getLogger('main-logger')
@@ -1,6 +1,11 @@
+import time
+
 from config import logger, config
+from prometheus_client import Histogram
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 # 📌 RDS config (flat key 구조 사용)
 RDS_DB = config['RDS_DATABASE']
@@ -11,12 +16,58 @@ RDS_PASSWORD = config['RDS_PASSWORD']
 
 # 🔥 RDS 연결 설정
 SQLALCHEMY_DATABASE_URL = f"mysql+pymysql://{RDS_USER}:{RDS_PASSWORD}@{RDS_HOST}:{RDS_PORT}/{RDS_DB}"
+SQLALCHEMY_ASYNC_DATABASE_URL = f"mysql+aiomysql://{RDS_USER}:{RDS_PASSWORD}@{RDS_HOST}:{RDS_PORT}/{RDS_DB}"
+
+# 📊 커넥션 풀 대기 시간 메트릭 (풀이 부족하면 이 값이 먼저 늘어남)
+POOL_CHECKOUT_WAIT = Histogram(
+    "bitenews_db_pool_checkout_wait_seconds",
+    "DB 커넥션 풀에서 커넥션을 얻기까지 대기한 시간",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+)
+
+
+class TimedPoolMixin:
+    """커넥션 checkout 대기 시간을 기록하는 풀"""
+    metric_label = "sync"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.labels(self.metric_label).observe(time.perf_counter() - start)
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    metric_label = "sync"
+
 
-# 🔥 RDS 연결 엔진 생성
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    metric_label = "async"
+
+
+# 🔥 커넥션 풀 설정 (환경변수로 조정)
+POOL_OPTIONS = {
+    "pool_size": config["DB_POOL_SIZE"],
+    "max_overflow": config["DB_MAX_OVERFLOW"],
+    "pool_timeout": config["DB_POOL_TIMEOUT"],
+    "pool_recycle": config["DB_POOL_RECYCLE"],  # RDS wait_timeout 전에 재연결
+    "pool_pre_ping": config["DB_POOL_PRE_PING"],  # 끊어진 커넥션 사용 방지
+}
+
+# 🔥 RDS 연결 엔진 생성 (쓰기/워커용 동기 엔진)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=TimedQueuePool, **POOL_OPTIONS)
+
+# 🔥 조회 API용 비동기 엔진 (이벤트 루프에서 스레드 풀을 거치지 않고 DB 접근)
+async_engine = create_async_engine(
+    SQLALCHEMY_ASYNC_DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool, **POOL_OPTIONS)
 
 # 🔥 세션 생성 (FastAPI 종속성으로 사용)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+logger.info(f"DB 커넥션 풀 설정: {POOL_OPTIONS}")
 
 # 🔥 DB 세션 의존성 주입
 def get_session():
@@ -25,3 +76,8 @@ def get_session():
         yield db
     finally:
         db.close()
+
+# 🔥 비동기 DB 세션 의존성 주입 (조회 API용)
+async def get_async_session():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,13 +1,77 @@
-from sqlalchemy import func
+import re
+import time
+from typing import List, Optional, TypedDict
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from model.article import Article
+from db.url import hash_source_url
 
 # ✅ 기사 데이터 삽입
 def insert_article(session: Session, article: Article):
+    if not article.url_hash:
+        article.url_hash = hash_source_url(article.source_url)
     session.add(article)
     session.commit() 
     session.refresh(article)
 
+# ✅ 원본 URL로 기사 조회 (url_hash unique index 사용)
+def find_article_by_source_url(session: Session, source_url: str):
+    return session.query(Article).filter(Article.url_hash == hash_source_url(source_url)).first()
+
+# ✅ 기사 데이터 삽입 (이미 수집된 URL이면 기존 기사 반환)
+def get_or_create_article(session: Session, article: Article):
+    """✅ (기사, 새로 생성 여부) 반환"""
+    existing = find_article_by_source_url(session, article.source_url)
+    if existing:
+        return existing, False
+
+    try:
+        insert_article(session, article)
+        return article, True
+    except IntegrityError:
+        # 동시에 같은 URL이 저장된 경우 → 먼저 저장된 기사 사용
+        session.rollback()
+        return find_article_by_source_url(session, article.source_url), False
+
+# ✅ 기사 여러 건 일괄 저장 (한 트랜잭션, 이미 수집된 URL/배치 내 중복 URL은 기존 기사 사용)
+def get_or_create_articles(session: Session, articles: List[Article]):
+    """✅ 입력 순서대로 (기사, 새로 생성 여부) 리스트 반환"""
+    for article in articles:
+        if not article.url_hash:
+            article.url_hash = hash_source_url(article.source_url)
+
+    # 이미 저장된 기사는 한 번의 쿼리로 조회
+    hashes = {article.url_hash for article in articles}
+    by_hash = {existing.url_hash: existing
+               for existing in session.query(Article).filter(Article.url_hash.in_(hashes))}
+
+    new_articles = []
+    for article in articles:
+        if article.url_hash not in by_hash:
+            by_hash[article.url_hash] = article
+            new_articles.append(article)
+
+    # commit 후 만료(expire)되면 호출 측에서 id/video_url을 읽을 때 기사마다 SELECT가 다시 실행되므로
+    # 이 commit에서는 만료하지 않음 (새 기사의 id는 INSERT 시점에 채워짐)
+    expire_on_commit = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        session.add_all(new_articles)
+        session.commit()
+    except IntegrityError:
+        # 동시에 같은 URL이 저장된 경우 → 한 건씩 다시 처리
+        session.rollback()
+        return [get_or_create_article(session, Article(
+            title=article.title, source_url=article.source_url,
+            source_created_at=article.source_created_at)) for article in articles]
+    finally:
+        session.expire_on_commit = expire_on_commit
+
+    created_ids = {id(article) for article in new_articles}
+    return [(by_hash[article.url_hash], id(article) in created_ids) for article in articles]
+
 # ✅ AWS S3 URL 업데이트 (비디오 & 썸네일)
 def update_article(session: Session, article_id: int , video_url: str, thumbnail_url: str):
     article = session.query(Article).filter(Article.id == article_id).first()
@@ -16,34 +80,93 @@ def update_article(session: Session, article_id: int , video_url: str, thumbnail
     session.commit()
     session.refresh(article)
 
+# ✅ 조회 API 공통 컬럼 (ORM 객체 대신 필요한 컬럼만 조회)
+ARTICLE_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.source_url,
+    Article.thumbnail_url,
+    Article.video_url,
+    Article.source_created_at,
+)
+
+
+# 📌 조회 API 응답용 기사 항목
+class ArticleItem(TypedDict):
+    id: int
+    title: str
+    source_url: str
+    thumbnail_url: Optional[str]
+    video_url: Optional[str]
+    source_created_at: str
+
+
+# ✅ ARTICLE_COLUMNS 조회 결과(Row) → 응답 dict 변환
+def article_to_dict(row) -> ArticleItem:
+    return row._asdict()
+
 # ✅ Article List Paging 조회 
 PAGE_SIZE = 8
-def get_articles(session: Session, page: int = 1):
-    """✅ 최신 ID순 (AutoIncrement 역순)으로 기사 리스트 조회 + Paging 정보 추가"""
-    try:
-        # 1️⃣ 전체 기사 개수 조회
-        total_count = session.query(func.count(Article.id)).scalar()
-        total_pages = (total_count + PAGE_SIZE - 1) // PAGE_SIZE  # 올림 처리
 
-        # 2️⃣ 최신 ID순으로 8개씩 페이징 처리 (ID DESC)
-        articles = (
-            session.query(Article)
+# 전체 페이지 수 계산용 기사 개수 캐시 (매 요청마다 COUNT(*) 하지 않도록 TTL 동안 재사용)
+TOTAL_COUNT_TTL = 60
+_total_count_cache = {"value": None, "expires_at": 0.0}
+
+
+def count_visible_articles(session: Session) -> int:
+    """✅ 비디오가 있는 기사 개수 (TTL 캐시)"""
+    now = time.monotonic()
+    if _total_count_cache["value"] is None or now >= _total_count_cache["expires_at"]:
+        _total_count_cache["value"] = (
+            session.query(func.count(Article.id))
+            .filter(Article.video_url.isnot(None))
+            .scalar()
+        )
+        _total_count_cache["expires_at"] = now + TOTAL_COUNT_TTL
+    return _total_count_cache["value"]
+
+
+def get_articles(session: Session, page: int = 1, before_id: Optional[int] = None):
+    """✅ 최신 ID순 (AutoIncrement 역순)으로 기사 리스트 조회 + Paging 정보 추가
+
+    - before_id가 주어지면 커서(keyset) 방식: id < before_id 인 기사부터 조회 (PK 인덱스 range scan)
+    - 없으면 기존 page 방식 (LIMIT/OFFSET)
+    """
+    try:
+        # 1️⃣ 비디오가 있는 기사만 최신 ID순으로 조회 (다음 페이지 확인용으로 1개 더 조회)
+        query = (
+            session.query(*ARTICLE_COLUMNS)
             .filter(Article.video_url.isnot(None))  # ✅ 비디오가 있는 것만
             .order_by(Article.id.desc())  # ✅ ID 역순 정렬 (최신 ID부터)
-            .limit(PAGE_SIZE)
-            .offset((page - 1) * PAGE_SIZE)
-            .all()
         )
+        if before_id is not None:
+            query = query.filter(Article.id < before_id)
+        else:
+            query = query.offset((page - 1) * PAGE_SIZE)
+        articles = query.limit(PAGE_SIZE + 1).all()
+
+        # 2️⃣ 추가 데이터 확인 (hasNextPage, hasFirstPage, totalPageCount)
+        has_next_page = len(articles) > PAGE_SIZE
+        articles = articles[:PAGE_SIZE]
+        if before_id is None:
+            has_prev_page = page > 1
+        else:
+            # 커서 방식: 커서보다 최신인(id >= before_id) 공개 기사가 있을 때만 이전 페이지 존재
+            has_prev_page = session.query(
+                session.query(Article.id)
+                .filter(Article.video_url.isnot(None), Article.id >= before_id)
+                .exists()
+            ).scalar()
 
-        # 3️⃣ 추가 데이터 확인 (hasNextPage, hasFirstPage, totalPageCount)
-        has_next_page = page < total_pages
-        has_prev_page = page > 1
+        total_count = count_visible_articles(session)
+        total_pages = (total_count + PAGE_SIZE - 1) // PAGE_SIZE  # 올림 처리 (TTL 캐시라 근사값)
 
         return {
-            "articles": [article.__dict__ for article in articles],  # ✅ SQLAlchemy 객체를 JSON 변환
-            "page": page,
+            "articles": [article_to_dict(article) for article in articles],
+            "page": page if before_id is None else None,  # 커서 방식에서는 페이지 번호 없음
             "hasPrev": has_prev_page,
             "hasNextPage": has_next_page,
+            "nextCursor": articles[-1].id if has_next_page else None,  # ✅ 다음 요청의 before_id
             "totalPageCount": total_pages
         }
     except Exception as e:
@@ -51,61 +174,88 @@ def get_articles(session: Session, page: int = 1):
     
 # ✅ Article 상세 조회
 def get_article_detail(session: Session, article_id: int):
-    """✅ 특정 기사 조회 + 이전/다음 기사 ID 포함 (ID ± 1 방식)"""
+    """✅ 특정 기사 조회 + 이전/다음 기사 ID 포함 (비디오가 있는 가장 가까운 기사, 쿼리 1회)"""
     try:
-        # 1️⃣ 현재 기사 조회
-        article = session.query(Article).filter(Article.id == article_id).first()
-        if not article:
-            return None  # 없는 경우 None 반환
-
-        # 2️⃣ 이전/다음 기사 ID 계산 (id + 1, id - 1)
-        prev_id = article_id + 1
-        next_id = article_id - 1
+        # 1️⃣ 이전(더 최신)/다음(더 오래된) 기사 ID: 비디오가 있는 기사 중 가장 가까운 ID (PK 인덱스 사용)
+        prev_id = (
+            select(func.min(Article.id))
+            .where(Article.id > article_id, Article.video_url.isnot(None))
+            .scalar_subquery()
+        )
+        next_id = (
+            select(func.max(Article.id))
+            .where(Article.id < article_id, Article.video_url.isnot(None))
+            .scalar_subquery()
+        )
 
-        # 3️⃣ 존재하는 ID인지 확인 (존재하지 않으면 None)
-        prev_exists = session.query(Article.id).filter(Article.id == prev_id).scalar()
-        next_exists = session.query(Article.id).filter(Article.id == next_id).scalar()
+        # 2️⃣ 현재 기사 + 이전/다음 기사 ID를 한 번에 조회
+        row = (
+            session.query(*ARTICLE_COLUMNS, prev_id.label("prev_id"), next_id.label("next_id"))
+            .filter(Article.id == article_id)
+            .first()
+        )
+        if not row:
+            return None  # 없는 경우 None 반환
 
-        return {
-            "id": article.id,
-            "title": article.title,
-            "source_url": article.source_url,
-            "thumbnail_url": article.thumbnail_url,
-            "video_url": article.video_url,
-            "source_created_at": article.source_created_at,
-            "prev_id": prev_id if prev_exists else None,  # ✅ 존재하면 유지, 없으면 None
-            "next_id": next_id if next_exists else None  # ✅ 존재하면 유지, 없으면 None
-        }
+        return row._asdict()  # ✅ 기사 컬럼 + prev_id/next_id (없으면 None)
     except Exception as e:
         raise RuntimeError(f"❌ 기사 상세 조회 오류: {e}")
 
 
 # ✅ Article 검색 조회
-def search_articles(session: Session, keyword: str):
-    """ ✅ 검색어로 숏폼 검색 """
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE = 10  # 최대 SEARCH_PAGE_SIZE * SEARCH_MAX_PAGE 건까지만 조회
+
+# ngram 파서의 토큰 길이 (MySQL ngram_token_size 기본값) - 이보다 짧은 단어는 FULLTEXT로 검색 불가
+NGRAM_TOKEN_SIZE = 2
+
+# BOOLEAN MODE 연산자로 해석되는 문자
+FULLTEXT_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+def build_fulltext_query(words: List[str]) -> str:
+    """각 단어를 필수 구문(+"단어")으로 변환 (ngram 인덱스 BOOLEAN MODE용)"""
+    return " ".join(f'+"{word}"' for word in words)
+
+
+def search_articles(session: Session, keyword: str, page: int = 1):
+    """ ✅ 검색어로 숏폼 검색 (제목 FULLTEXT ngram 인덱스, 관련도순 + 페이징) """
     try:
+        page = min(max(page, 1), SEARCH_MAX_PAGE)
+        words = FULLTEXT_OPERATORS.sub(" ", keyword).split()
+        if not words:
+            return {"articles": [], "page": page, "hasNextPage": False}
+
+        query = session.query(*ARTICLE_COLUMNS).filter(Article.video_url.isnot(None))
+
+        # ngram 토큰보다 짧은 단어(예: "윤 대통령"의 "윤")는 FULLTEXT로 검색할 수 없으므로 LIKE 조건으로 추가
+        indexed_words = [word for word in words if len(word) >= NGRAM_TOKEN_SIZE]
+        short_words = [word for word in words if len(word) < NGRAM_TOKEN_SIZE]
+        for word in short_words:
+            query = query.filter(Article.title.contains(word, autoescape=True))
+
+        if indexed_words:
+            # ✅ 긴 단어는 FULLTEXT 인덱스로 검색 후 관련도순 정렬 (짧은 단어 LIKE는 인덱스로 좁힌 결과에만 적용)
+            score = match(Article.title, against=build_fulltext_query(indexed_words), in_boolean_mode=True)
+            query = query.filter(score > 0).order_by(score.desc(), Article.id.desc())
+        else:
+            # 모두 한 글자 검색어면 최신순 LIKE 검색 (LIMIT으로 범위 제한)
+            query = query.order_by(Article.id.desc())
+
         videos = (
-            session.query(Article)
-            .filter(Article.video_url.isnot(None))
-            .filter(Article.title.ilike(f"%{keyword}%"))  # ✅ 제목에 검색어 포함
-            .order_by(Article.source_created_at.desc())
+            query
+            .offset((page - 1) * SEARCH_PAGE_SIZE)
+            .limit(SEARCH_PAGE_SIZE + 1)  # 다음 페이지 확인용으로 1개 더 조회
             .all()
         )
+        has_next_page = len(videos) > SEARCH_PAGE_SIZE and page < SEARCH_MAX_PAGE
 
-        video_list = [
-            {
-                "id": video.id,
-                "title": video.title,
-                "source_url": video.source_url,
-                "thumbnail_url": video.thumbnail_url,
-                "video_url": video.video_url,
-                "source_created_at": video.source_created_at
-            }
-            for video in videos
-        ]
+        video_list = [article_to_dict(video) for video in videos[:SEARCH_PAGE_SIZE]]
 
         return {
-            "articles": video_list
+            "articles": video_list,
+            "page": page,
+            "hasNextPage": has_next_page
         }
     except Exception as e:
-        raise RuntimeError(f"❌ 비디오 검색 오류: {e}")
\ No newline at end of file
+        raise RuntimeError(f"❌ 비디오 검색 오류: {e}")
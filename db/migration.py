@@ -0,0 +1,83 @@
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from config import logger
+from db.url import hash_source_url
+
+
+# ✅ DB 테이블 생성 (최초 실행 시 필요) + 기존 테이블 스키마 보정
+# import 시점이 아니라 서버 시작 시 또는 `python -m db.migration`으로 명시적으로 실행
+def init_schema(engine: Optional[Engine] = None):
+    from db.connection import engine as default_engine
+    from model.article import Base
+
+    engine = engine or default_engine
+    Base.metadata.create_all(bind=engine)
+    migrate(engine)
+    logger.info("🛠️ DB 스키마 확인 완료")
+
+
+# ✅ 기존 articles 테이블 스키마 보정 (create_all은 기존 테이블에 컬럼을 추가하지 않음)
+def migrate(engine: Engine):
+    inspector = inspect(engine)
+    if "articles" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("articles")}
+    if "url_hash" not in columns:
+        _add_url_hash_column(engine)
+
+    # MySQL DDL은 트랜잭션으로 묶이지 않으므로 컬럼과 별도로 unique index를 확인
+    # (backfill/인덱스 생성이 중간에 실패했으면 다음 시작 시 이어서 진행)
+    indexes = inspector.get_indexes("articles")
+    unique_columns = [index["column_names"] for index in indexes if index["unique"]]
+    unique_columns += [constraint["column_names"] for constraint in inspector.get_unique_constraints("articles")]
+    if ["url_hash"] not in unique_columns:
+        _add_url_hash_index(engine)
+
+    if "ft_articles_title" not in {index["name"] for index in indexes}:
+        _add_title_fulltext_index(engine)
+
+
+def _add_url_hash_column(engine: Engine):
+    logger.info("🛠️ articles.url_hash 컬럼 추가 중")
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE articles ADD COLUMN url_hash VARCHAR(64) NULL"))
+    logger.info("✅ articles.url_hash 컬럼 추가 완료")
+
+
+def _add_url_hash_index(engine: Engine):
+    """url_hash가 비어 있는 행 backfill → unique index 생성 (여러 번 실행해도 안전)"""
+    logger.info("🛠️ articles.url_hash backfill / unique index 생성 중")
+    with engine.begin() as conn:
+        # 이미 채워진 hash는 건너뛰고, 같은 URL이 여러 번 저장된 경우 영상이 있는 가장 오래된 행에만 hash를 채움
+        seen = set(conn.execute(text(
+            "SELECT url_hash FROM articles WHERE url_hash IS NOT NULL")).scalars())
+        rows = conn.execute(text(
+            "SELECT id, source_url FROM articles WHERE url_hash IS NULL ORDER BY video_url IS NULL, id")).all()
+        for article_id, source_url in rows:
+            url_hash = hash_source_url(source_url)
+            if url_hash in seen:
+                continue
+            seen.add(url_hash)
+            conn.execute(text("UPDATE articles SET url_hash = :url_hash WHERE id = :id"),
+                         {"url_hash": url_hash, "id": article_id})
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE UNIQUE INDEX ix_articles_url_hash ON articles (url_hash)"))
+    logger.info("✅ articles.url_hash unique index 생성 완료")
+
+
+def _add_title_fulltext_index(engine: Engine):
+    """제목 검색용 FULLTEXT(ngram) 인덱스 생성"""
+    logger.info("🛠️ articles.title FULLTEXT 인덱스 생성 중")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE articles ADD FULLTEXT INDEX ft_articles_title (title) WITH PARSER ngram"))
+    logger.info("✅ articles.title FULLTEXT 인덱스 생성 완료")
+
+
+if __name__ == "__main__":
+    init_schema()
@@ -0,0 +1,36 @@
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 같은 기사를 가리키지만 값이 달라지는 쿼리 파라미터 (카테고리, 트래킹 등)
+IGNORED_QUERY_PARAMS = {"sid", "sid1", "sid2", "mode", "type", "ntype", "rc", "fbclid", "gclid"}
+
+# 네이버 뉴스 기사 URL (n.news.naver.com/mnews/article/{oid}/{aid}, news.naver.com/article/{oid}/{aid} 등)
+NAVER_ARTICLE_PATH = re.compile(r"^/(?:mnews/)?article/(\d+)/(\d+)")
+
+
+# ✅ 원본 기사 URL 정규화
+def normalize_source_url(url: str) -> str:
+    """같은 기사를 가리키는 URL이 하나의 값이 되도록 정규화"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    # 네이버 뉴스는 카테고리/경로와 무관하게 언론사 ID + 기사 ID로 식별
+    if host.endswith("news.naver.com"):
+        match = NAVER_ARTICLE_PATH.match(parts.path)
+        params = dict(query)
+        if match:
+            return f"https://n.news.naver.com/mnews/article/{match.group(1)}/{match.group(2)}"
+        if "oid" in params and "aid" in params:
+            return f"https://n.news.naver.com/mnews/article/{params['oid']}/{params['aid']}"
+
+    query = sorted((key, value) for key, value in query
+                   if key not in IGNORED_QUERY_PARAMS and not key.startswith("utm_"))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(((parts.scheme or "https").lower(), host, path, urlencode(query), ""))
+
+
+def hash_source_url(url: str) -> str:
+    """정규화된 URL의 sha256 (articles.url_hash)"""
+    return hashlib.sha256(normalize_source_url(url).encode("utf-8")).hexdigest()
@@ -1,16 +1,30 @@
+import time
+
+# ✅ 콜드 스타트 측정 (모듈 로드 시작 시점)
+INIT_START = time.perf_counter()
+
 import os
 import json
 import requests
 import logging
-import time
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from lxml import etree  # 빠른 HTML 파서 (없으면 BeautifulSoup 사용)
+except ImportError:
+    etree = None
 
 # ✅ 로깅 설정
 logging.basicConfig(level=logging.INFO)
 
 # ✅ 환경 변수에서 API 엔드포인트 가져오기
 FASTAPI_SERVER_URL = os.getenv("FASTAPI_SERVER_URL", "http://3.34.177.106:8000/ai/video")
+FASTAPI_BATCH_URL = os.getenv("FASTAPI_BATCH_URL", f"{FASTAPI_SERVER_URL.rstrip('/')}/batch")
 
 # ✅ 헤더 설정 (크롤링 차단 방지)
 header = {
@@ -18,8 +32,157 @@ header = {
                    "(KHTML, like Gecko) Chrome/104.0.0.0 Safari/537.36"),
 }
 
-# ✅ 현재 시간 (UTC+9 기준)
-CURRENT_TIME = datetime.now()
+# ✅ 동시 크롤링 설정 (동시 요청 수 / 같은 호스트에 대한 최소 요청 간격(초))
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "8"))
+CRAWL_HOST_INTERVAL = float(os.getenv("CRAWL_HOST_INTERVAL", "0.2"))
+REQUEST_TIMEOUT = float(os.getenv("CRAWL_REQUEST_TIMEOUT", "10"))
+
+
+# ✅ 호스트별 요청 간격 제한 (여러 스레드가 동시에 요청해도 같은 호스트에는 간격을 두고 전송)
+class HostRateLimiter:
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_slot = {}  # host -> 다음 요청 가능 시각
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# ✅ 커넥션 재사용을 위한 공유 세션 (웜 스타트 시에도 재사용)
+def create_session():
+    session = requests.Session()
+    session.headers.update(header)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=CRAWL_WORKERS,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=("GET",)),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+session = create_session()
+rate_limiter = HostRateLimiter(CRAWL_HOST_INTERVAL)
+
+
+def fetch(url, validators=None):
+    """호스트별 간격 제한을 지키며 공유 세션으로 GET 요청
+
+    validators({"etag": ..., "last_modified": ...})를 넘기면 조건부 요청을 보내며,
+    변경이 없으면 304 응답이 그대로 반환됩니다.
+    """
+    request_headers = {}
+    if validators:
+        if validators.get("etag"):
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+
+    rate_limiter.wait(url)
+    response = session.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response
+
+# ✅ 기사 시간은 한국 시간(UTC+9) 기준 (Lambda 기본 시간대는 UTC)
+KST = timezone(timedelta(hours=9))
+RECENT_WINDOW = timedelta(hours=3)
+
+
+def now_kst():
+    # 컨테이너가 재사용(웜 스타트)되어도 실행 시점 기준으로 계산
+    return datetime.now(KST).replace(tzinfo=None)
+
+# ✅ 크롤링 상태 저장 위치 (CRAWL_STATE_BUCKET 설정 시 S3, 없으면 /tmp 파일 - 웜 컨테이너에서만 유지)
+CRAWL_STATE_BUCKET = os.getenv("CRAWL_STATE_BUCKET")
+CRAWL_STATE_KEY = os.getenv("CRAWL_STATE_KEY", "crawler/state.json")
+CRAWL_STATE_PATH = os.getenv("CRAWL_STATE_PATH", "/tmp/crawl_state.json")
+SEEN_RETENTION = timedelta(hours=int(os.getenv("CRAWL_SEEN_RETENTION_HOURS", "48")))
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+# ✅ 증분 크롤링 상태 (이미 처리한 기사 URL, 헤드라인 페이지 ETag/Last-Modified)
+class CrawlState:
+    def __init__(self, data=None):
+        data = data or {}
+        self.seen = data.get("seen", {})  # 기사 URL -> 처리 시각
+        self.validators = data.get("validators", {})  # 헤드라인 URL -> {"etag", "last_modified"}
+        self._lock = threading.Lock()
+
+    def is_seen(self, url):
+        with self._lock:
+            return url in self.seen
+
+    def mark_seen(self, url, now):
+        with self._lock:
+            self.seen[url] = now.strftime(TIME_FORMAT)
+
+    def set_validators(self, url, response):
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        with self._lock:
+            if validators["etag"] or validators["last_modified"]:
+                self.validators[url] = validators
+            else:
+                self.validators.pop(url, None)
+
+    def prune(self, now):
+        """보관 기간이 지난 seen 항목 정리 (헤드라인에서 이미 내려간 기사)"""
+        cutoff = (now - SEEN_RETENTION).strftime(TIME_FORMAT)
+        with self._lock:
+            self.seen = {url: seen_at for url, seen_at in self.seen.items() if seen_at >= cutoff}
+
+    def to_dict(self):
+        with self._lock:
+            return {"seen": self.seen, "validators": self.validators}
+
+
+def load_crawl_state():
+    try:
+        if CRAWL_STATE_BUCKET:
+            import boto3  # Lambda 런타임 기본 제공
+
+            s3 = boto3.client("s3")
+            try:
+                body = s3.get_object(Bucket=CRAWL_STATE_BUCKET, Key=CRAWL_STATE_KEY)["Body"].read()
+            except s3.exceptions.NoSuchKey:
+                return CrawlState()
+            return CrawlState(json.loads(body))
+
+        if os.path.exists(CRAWL_STATE_PATH):
+            with open(CRAWL_STATE_PATH, "r", encoding="utf-8") as f:
+                return CrawlState(json.load(f))
+    except Exception as e:
+        # 상태를 읽지 못해도 크롤링은 진행 (서버에서 URL 기준으로 중복 제거)
+        logging.error(f"크롤링 상태 로드 실패: {e}")
+    return CrawlState()
+
+
+def save_crawl_state(state):
+    body = json.dumps(state.to_dict(), ensure_ascii=False)
+    try:
+        if CRAWL_STATE_BUCKET:
+            import boto3
+
+            boto3.client("s3").put_object(Bucket=CRAWL_STATE_BUCKET, Key=CRAWL_STATE_KEY,
+                                          Body=body.encode("utf-8"), ContentType="application/json")
+        else:
+            tmp_path = f"{CRAWL_STATE_PATH}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(body)
+            os.replace(tmp_path, CRAWL_STATE_PATH)
+    except Exception as e:
+        logging.error(f"크롤링 상태 저장 실패: {e}")
 
 # ✅ 크롤링할 네이버 뉴스 카테고리
 categories = {
@@ -28,25 +191,142 @@ categories = {
     "사회": "https://news.naver.com/section/102",
 }
 
+# ✅ HTML 추출기 설정 (CRAWL_PARSER=lxml | bs4)
+CRAWL_PARSER = os.getenv("CRAWL_PARSER", "lxml")
+HEADLINE_LIMIT = 5
+PARSE_CHUNK_SIZE = 16 * 1024  # 이 크기만큼씩 파서에 넣고, 필요한 노드를 찾으면 중단
+
+ARTICLE_TIME_CLASSES = {"media_end_head_info_datestamp_time", "_ARTICLE_DATE_TIME"}
+HEADLINE_ITEM_CLASSES = {"sa_item", "_SECTION_HEADLINE"}
+
+
+def _classes(element):
+    return set((element.get("class") or "").split())
+
+
+class SoupExtractor:
+    """BeautifulSoup(html.parser) 기반 추출기 - 문서 전체를 파싱 (lxml 미설치 환경용)"""
+    name = "bs4"
+
+    def extract_article(self, html):
+        """{"title", "content", "timestamp"} 반환 (찾지 못한 값은 None)"""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        title_tag = soup.find("h2", {"id": "title_area"})
+        content_tag = soup.find("article", {"id": "dic_area"})
+        timestamp_tag = soup.find("span", {"class": "media_end_head_info_datestamp_time _ARTICLE_DATE_TIME"})
+        return {
+            "title": title_tag.text if title_tag else None,
+            "content": content_tag.text if content_tag else None,
+            "timestamp": timestamp_tag.get("data-date-time") if timestamp_tag else None,
+        }
+
+    def extract_headlines(self, html, limit=HEADLINE_LIMIT):
+        """[{"title", "link"}] 반환 (헤드라인 리스트가 없으면 None)"""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        headline_list = soup.find("ul", class_="sa_list")
+        if not headline_list:
+            return None
+
+        headlines = []
+        for item in headline_list.find_all("li", class_="sa_item _SECTION_HEADLINE")[:limit]:
+            title_tag = item.find("a", class_="sa_text_title")
+            headlines.append({
+                "title": title_tag.find("strong", class_="sa_text_strong").text.strip(),
+                "link": title_tag["href"],
+            })
+        return headlines
+
+
+class LxmlExtractor:
+    """lxml HTMLPullParser 기반 추출기 - 필요한 노드를 모두 찾으면 나머지 문서는 파싱하지 않음"""
+    name = "lxml"
+
+    @staticmethod
+    def _events(html, events):
+        parser = etree.HTMLPullParser(events=events)
+        for start in range(0, len(html), PARSE_CHUNK_SIZE):
+            parser.feed(html[start:start + PARSE_CHUNK_SIZE])
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    @staticmethod
+    def _text(element):
+        # BeautifulSoup .text와 같이 주석/스크립트를 제외한 텍스트
+        return "".join(element.xpath(".//text()[not(parent::script) and not(parent::style)]"))
+
+    def extract_article(self, html):
+        result = {"title": None, "content": None, "timestamp": None}
+        for _, element in self._events(html, ("end",)):
+            if element.tag == "h2" and element.get("id") == "title_area":
+                result["title"] = self._text(element)
+            elif element.tag == "article" and element.get("id") == "dic_area":
+                result["content"] = self._text(element)
+            elif (element.tag == "span" and result["timestamp"] is None
+                  and ARTICLE_TIME_CLASSES <= _classes(element)):
+                result["timestamp"] = element.get("data-date-time")
+
+            if None not in result.values():
+                break
+        return result
+
+    def extract_headlines(self, html, limit=HEADLINE_LIMIT):
+        headline_list = None
+        headlines = []
+        for event, element in self._events(html, ("start", "end")):
+            if event == "start":
+                if headline_list is None and element.tag == "ul" and "sa_list" in _classes(element):
+                    headline_list = element
+                continue
+
+            if element is headline_list:
+                break
+            if (element.tag == "li" and element.getparent() is headline_list
+                    and HEADLINE_ITEM_CLASSES <= _classes(element)):
+                title_tag = next(a for a in element.iter("a") if "sa_text_title" in _classes(a))
+                strong = next(s for s in title_tag.iter("strong") if "sa_text_strong" in _classes(s))
+                headlines.append({"title": self._text(strong).strip(), "link": title_tag.get("href")})
+                if len(headlines) >= limit:
+                    break
+        return headlines if headline_list is not None else None
+
+
+EXTRACTORS = {"bs4": SoupExtractor(), "lxml": LxmlExtractor()}
+
+
+def get_extractor(name=CRAWL_PARSER):
+    if name == "lxml" and etree is None:
+        logging.warning("lxml이 설치되지 않아 BeautifulSoup 추출기를 사용합니다.")
+        name = "bs4"
+    return EXTRACTORS[name]
+
+
+extractor = get_extractor()
+
+# ✅ 모듈 로드(init) 소요 시간 - 컨테이너 재사용(웜 스타트) 시에는 다시 실행되지 않음
+INIT_DURATION = time.perf_counter() - INIT_START
+cold_start = True
+
 # 📰 개별 기사 크롤링 함수
 def scrape_article(article_url):
     try:
-        time.sleep(1)  # 요청 간격 조정 (네이버 서버 차단 방지)
-        response = requests.get(article_url, headers=header)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = fetch(article_url)
+        extracted = extractor.extract_article(response.text)
 
         # ✅ 기사 제목 찾기
-        title_tag = soup.find("h2", {"id": "title_area"})
-        title = title_tag.text.strip() if title_tag else "제목 없음"
+        title = extracted["title"].strip() if extracted["title"] is not None else "제목 없음"
 
         # ✅ 기사 본문 찾기
-        content_tag = soup.find("article", {"id": "dic_area"})
-        content = content_tag.text.strip().replace('\\"', '"').replace("\n", " ") if content_tag else "본문 없음"
+        content = extracted["content"]
+        content = content.strip().replace('\\"', '"').replace("\n", " ") if content is not None else "본문 없음"
 
         # ✅ 기사 생성 시간 찾기
-        timestamp_tag = soup.find("span", {"class": "media_end_head_info_datestamp_time _ARTICLE_DATE_TIME"}) 
-        if timestamp_tag and "data-date-time" in timestamp_tag.attrs:
-            article_time = datetime.strptime(timestamp_tag["data-date-time"], "%Y-%m-%d %H:%M:%S")
+        if extracted["timestamp"]:
+            article_time = datetime.strptime(extracted["timestamp"], "%Y-%m-%d %H:%M:%S")
         else:
             article_time = None
 
@@ -60,81 +340,130 @@ def scrape_article(article_url):
         logging.error(f"기사 크롤링 실패: {article_url}, 오류: {e}")
         return None
 
-# 🚀 FastAPI 서버로 데이터 전송 함수
-def post_article_to_server(article_data):
-    headers = {"Content-Type": "application/json"}
-    try:
-        logging.info(f"📤 BiteNews에 기사 전송 중: {article_data['title']}")
-        response = requests.post(FASTAPI_SERVER_URL, json=article_data, headers=headers)
-        if response.status_code == 201:
-            response_data = response.json()
-            logging.info(f"📥 FastAPI 응답 수신 완료: {response_data}")
-
-            # ✅ 숏폼 생성 완료 or 실패 로그 남김
-            if response_data.get("status") == "success":
-                logging.info(f"✅ 숏폼 생성 완료: {article_data['title']}")
-            else:
-                logging.warning(f"⚠️ 숏폼 생성 실패: {article_data['title']}, 이유: {response_data.get('message', '알 수 없음')}")
+# 🚀 FastAPI 서버로 기사 일괄 전송 함수 (요청 1회, 렌더링은 서버 워커에서 비동기로 진행)
+def post_articles_to_server(articles):
+    """숏폼 생성이 끝난(published) 기사 링크 목록 반환
 
-        else:
+    작업 큐는 서버 메모리에만 있어 실패/재시작 시 다시 실행되지 않으므로, 대기/진행 중인 기사는
+    다음 실행에서 다시 전송합니다. (진행 중이면 서버에서 기존 작업으로 합쳐지고, 실패했으면 다시 등록됨)
+    """
+    if not articles:
+        return []
+    try:
+        logging.info(f"📤 BiteNews에 기사 {len(articles)}건 일괄 전송 중")
+        response = session.post(FASTAPI_BATCH_URL, json=articles, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 202:
             logging.error(f"❌ BiteNews 오류 {response.status_code}: {response.text}")
+            return []
+
+        items = response.json().get("data") or []
+        published_links = []
+        for item in items:
+            if item.get("status") == "published":
+                logging.info(f"♻️ 이미 생성된 기사: {item['article_id']} ({item['link']})")
+                published_links.append(item["link"])
+            else:
+                logging.info(f"✅ 숏폼 생성 작업 등록: {item['article_id']} (job {item.get('job_id')}, {item.get('status')})")
+        return published_links
     except requests.exceptions.RequestException as e:
         logging.error(f"❌ BiteNews 서버 연결 실패: {e}")
+        return []
 
 # ⏳ 3시간 이내 기사 필터링 함수
-def filter_recent_articles(article_urls):
+def filter_recent_articles(article_urls, category, state, now):
+    """처음 보는 기사만 요청해서 3시간 이내 기사만 반환"""
     valid_articles = []
-    three_hours_ago = CURRENT_TIME - timedelta(hours=3)
-
-    for url in article_urls:
-        article_data = scrape_article(url)
-        
-        # 3시간 이내 기사만 추가
-        if article_data["timestamp"] >= three_hours_ago:
-            article_data["timestamp"] = article_data["timestamp"].strftime("%Y-%m-%dT%H:%M:%S+09:00")
+    three_hours_ago = now - RECENT_WINDOW
+
+    # 이미 처리한 기사 페이지는 다시 요청하지 않음
+    new_urls = [url for url in article_urls if not state.is_seen(url)]
+    if len(new_urls) < len(article_urls):
+        logging.info(f"{category}: 이미 처리한 기사 {len(article_urls) - len(new_urls)}건 건너뜀")
+
+    # 기사 페이지는 동시에 요청 (같은 호스트 요청 간격은 rate_limiter가 조절)
+    with ThreadPoolExecutor(max_workers=CRAWL_WORKERS, thread_name_prefix="crawl-article") as executor:
+        scraped_articles = list(executor.map(scrape_article, new_urls))
+
+    for url, article_data in zip(new_urls, scraped_articles):
+        # 요청 실패한 기사는 다음 실행에서 다시 시도
+        if article_data is None:
+            continue
+
+        article_time = article_data["timestamp"]
+        if article_time is None:
+            logging.warning(f"{category}: 기사 시간 없음, 건너뜀 ({url})")
+            state.mark_seen(url, now)
+            continue
+
+        # 3시간 이내 기사만 추가 (숏폼 생성이 끝난 것을 서버에서 확인한 뒤 seen 처리)
+        if article_time >= three_hours_ago:
+            article_data["timestamp"] = article_time.strftime("%Y-%m-%dT%H:%M:%S+09:00")
             valid_articles.append(article_data)
+        else:
+            state.mark_seen(url, now)
 
     return valid_articles
 
 # 📌 헤드라인 뉴스 크롤링 함수
-def check_for_new_articles(base_url, category):
+def check_for_new_articles(base_url, category, state, now):
+    """(헤드라인 응답, 헤드라인 기사 링크, 전송할 새 기사 목록) 반환 - 변경 없거나 실패 시 None"""
     try:
-        news_data = []
-        response = requests.get(base_url, headers=header)
-        soup = BeautifulSoup(response.text, "html.parser")
-        headline_list = soup.find("ul", class_="sa_list")
-        
-        if not headline_list:
-            logging.warning(f"{category}: 헤드라인 뉴스 리스트를 찾을 수 없음")
-            return
+        response = fetch(base_url, state.validators.get(base_url))
+        if response.status_code == 304:
+            logging.info(f"{category}: 헤드라인 변경 없음 (304)")
+            return None
 
-        for item in headline_list.find_all("li", class_="sa_item _SECTION_HEADLINE")[:5]:
-            title_tag = item.find("a", class_="sa_text_title")
-            title = title_tag.find("strong", class_="sa_text_strong").text.strip()
-            link = title_tag["href"]
-            news_data.append({'title': title, 'link': link})
+        news_data = extractor.extract_headlines(response.text, HEADLINE_LIMIT)
+        if news_data is None:
+            logging.warning(f"{category}: 헤드라인 뉴스 리스트를 찾을 수 없음")
+            return None
 
-        # 🔥 3시간 이내 기사 필터링
+        # 🔥 새 기사만 요청 + 3시간 이내 기사 필터링
         article_links = [news["link"] for news in news_data]
-        recent_articles = filter_recent_articles(article_links)
-
-        # 결과 출력
-        for article in recent_articles:
-            post_article_to_server(article)
+        recent_articles = filter_recent_articles(article_links, category, state, now)
+        return response, article_links, recent_articles
 
     except Exception as e:
         logging.error(f"{category} 크롤링 실패: {e}")
+        return None
 
 # 🔄 전체 카테고리 크롤링 실행 함수
 def scrap_all_categories():
-    for category, base_url in categories.items():
+    state = load_crawl_state()
+    now = now_kst()
+
+    # 카테고리별 크롤링을 동시에 실행 (요청 간격은 호스트 단위로 rate_limiter가 조절)
+    def crawl(item):
+        category, base_url = item
         logging.info(f"📡 {category} 크롤링 시작 ({base_url})")
-        check_for_new_articles(base_url, category)
-        time.sleep(1)  # 요청 간격 조정
+        return check_for_new_articles(base_url, category, state, now)
+
+    with ThreadPoolExecutor(max_workers=len(categories), thread_name_prefix="crawl-category") as executor:
+        results = dict(zip(categories.values(), executor.map(crawl, categories.items())))
+
+    # 전체 카테고리의 새 기사를 한 번에 전송 (여러 카테고리에 걸친 같은 기사는 서버에서 한 건으로 처리)
+    # 숏폼 생성이 끝난 기사만 seen 처리 → 대기/진행 중이거나 실패한 기사는 3시간 동안 다음 실행에서 다시 전송
+    articles = [article for result in results.values() if result for article in result[2]]
+    for link in post_articles_to_server(articles):
+        state.mark_seen(link, now)
+
+    # 헤드라인의 모든 기사를 처리한 뒤에만 validator 저장 (실패한 기사가 있으면 다음 실행에서 다시 확인)
+    for base_url, result in results.items():
+        if result and all(state.is_seen(link) for link in result[1]):
+            state.set_validators(base_url, result[0])
+
+    state.prune(now)
+    save_crawl_state(state)
+    logging.info(f"크롤링 상태 저장: 처리한 기사 {len(state.seen)}건, 헤드라인 validator {len(state.validators)}건")
 
 # AWS Lambda용 핸들러 함수
 def lambda_handler(event, context):
-    logging.info("Lambda 실행 시작")
+    global cold_start
+    if cold_start:
+        logging.info(f"Lambda 실행 시작 (콜드 스타트, init {INIT_DURATION:.3f}s)")
+        cold_start = False
+    else:
+        logging.info("Lambda 실행 시작 (웜 스타트)")
     scrap_all_categories()
     return {
         "statusCode": 200,
@@ -1,17 +1,54 @@
+import time
+
+# 📊 콜드 스타트 측정 시작 시점 (모듈 import ~ 서버 시작 완료)
+PROCESS_START = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
 from pydantic import BaseModel
 from model.article import Article
 
 from config import logger, config
-from aws.s3 import upload_to_s3
-from db.connection import get_session
-from db.crud import insert_article, update_article, get_articles, get_article_detail, search_articles
+from db.connection import get_session, get_async_session, async_engine, engine
+from db.migration import init_schema
+from db.crud import get_or_create_article, get_or_create_articles, get_articles, get_article_detail, search_articles
+from cache.response_cache import response_cache
+from worker.job_queue import RenderJobQueue
+from worker.render import process_render_job
+
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, Gauge, generate_latest
 
-from fastapi import Depends, FastAPI, HTTPException
+# 영상 생성 작업 큐 (워커 스레드 풀)
+render_queue = RenderJobQueue(process_render_job, num_workers=config["RENDER_WORKERS"])
 
-from article import create_article
+# 📊 모듈 import 소요 시간 / 서버 시작 완료까지 소요 시간
+IMPORT_DURATION = time.perf_counter() - PROCESS_START
+COLD_START_SECONDS = Gauge("bitenews_cold_start_seconds", "서버 콜드 스타트 소요 시간", ["phase"])
+COLD_START_SECONDS.labels("import").set(IMPORT_DURATION)
 
-# FastAPI 앱 생성
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 테이블 생성/스키마 보정은 import 시점이 아니라 서버 시작 시 1회 실행
+    if config["DB_AUTO_MIGRATE"]:
+        init_schema(engine)
+    render_queue.start()
+
+    startup_duration = time.perf_counter() - PROCESS_START
+    COLD_START_SECONDS.labels("startup").set(startup_duration)
+    logger.info(f"🚀 서버 시작 완료: import {IMPORT_DURATION:.2f}s, 전체 {startup_duration:.2f}s")
+
+    try:
+        yield
+    finally:
+        render_queue.stop()
+        await async_engine.dispose()
+
+# FastAPI 앱 생성 (orjson으로 응답 직렬화)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # 📌 요청 데이터 모델 정의
 
@@ -22,57 +59,129 @@ class ArticleRequestDto(BaseModel):
     link: str
     timestamp: str
 
-# ✅ FastAPI 엔드포인트: AWS Lambda로부터 News Article 정보 수신 및 Shortform 생성
+# ✅ FastAPI 엔드포인트: AWS Lambda로부터 News Article 정보 수신 및 Shortform 생성 작업 등록
 
 
-@app.post("/ai/video", status_code=201)
-async def receive_article_and_make_shortform(article_request_dto: ArticleRequestDto, session=Depends(get_session)):
+@app.post("/ai/video", status_code=202)
+def receive_article_and_make_shortform(article_request_dto: ArticleRequestDto, response: Response,
+                                       profile: bool = False, session=Depends(get_session)):
     logger.info(f"📥 기사 정보 수신: {article_request_dto.title}")
 
     try:
-        # ✅ 1️⃣ Article 정보 저장
-        new_article = Article(title=article_request_dto.title, source_url=article_request_dto.link,
-                              source_created_at=article_request_dto.timestamp)
-        insert_article(session, new_article)
-        logger.info(f"📥 기사 DB 저장 완료: {article_request_dto.title}")
-
-        # ✅ 2️⃣ 썸네일 & 비디오 생성
-        create_article(article_request_dto.title, article_request_dto.content)
-        thumbnail_path = "output/thumbnail.png"
-        video_path = "output/final_video.mp4"
-        logger.info(f"✅ 비디오 생성 완료: {new_article.id} : {new_article.title}")
-
-        # ✅ 3️⃣ S3 업로드 (썸네일 + 영상)
-        thumbnail_url = upload_to_s3(
-            thumbnail_path, f"article/{new_article.id}/thumbnail.png", "image/png")
-        video_url = upload_to_s3(
-            video_path, f"article/{new_article.id}/video.mp4", "video/mp4")
-        logger.info(f"✅ S3 업로드 완료: {new_article.id} : {new_article.title}")
-
-        # ✅ 4️⃣ Article 정보 업데이트 (S3 URL)
-        update_article(session, new_article.id, video_url, thumbnail_url)
-        logger.info(f"✅ 기사 DB 업데이트 완료: {new_article.id} : {new_article.title}")
-
-        return {"status": "success", "message": "✅ 기사 숏폼 생성 성공!"}
+        # ✅ 1️⃣ Article 정보 저장 (이미 수집된 URL이면 기존 기사 사용)
+        article, created = get_or_create_article(session, Article(
+            title=article_request_dto.title, source_url=article_request_dto.link,
+            source_created_at=article_request_dto.timestamp))
+
+        if created:
+            logger.info(f"📥 기사 DB 저장 완료: {article_request_dto.title}")
+        elif article.video_url:
+            # 이미 숏폼이 생성된 기사 → 다시 생성하지 않고 기존 결과 반환
+            logger.info(f"♻️ 이미 생성된 기사: {article.id} : {article.title}")
+            response.status_code = 200
+            return {"status": "success", "message": "✅ 이미 생성된 기사 숏폼입니다.", "data": {
+                "article_id": article.id,
+                "video_url": article.video_url,
+                "thumbnail_url": article.thumbnail_url,
+            }}
+        else:
+            logger.info(f"♻️ 이미 수집된 기사 (영상 생성 전): {article.id} : {article.title}")
+
+        # ✅ 2️⃣ 영상 생성 작업 등록 (생성/업로드/DB 업데이트는 워커에서 처리)
+        #    같은 기사의 작업이 대기/진행 중이면 새로 등록하지 않고 해당 작업 반환
+        #    profile=true 이면 이 작업 1회를 프로파일링 (PROFILE_DIR에 저장)
+        job = render_queue.submit(article.id, article_request_dto.title, article_request_dto.content, profile)
+
+        return {"status": "accepted", "message": "✅ 기사 숏폼 생성 작업 등록!", "data": job.to_dict()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"❌ 서버 오류: {e}")
+
+# 한 번에 받을 수 있는 최대 기사 수
+MAX_BATCH_ARTICLES = 100
+
+# ✅ FastAPI 엔드포인트: 기사 여러 건을 한 번에 수신 (크롤러 1회 실행 = 요청 1회)
+
+
+@app.post("/ai/video/batch", status_code=202)
+def receive_articles_and_make_shortforms(article_request_dtos: List[ArticleRequestDto],
+                                         session=Depends(get_session)):
+    logger.info(f"📥 기사 일괄 수신: {len(article_request_dtos)}건")
+    if len(article_request_dtos) > MAX_BATCH_ARTICLES:
+        raise HTTPException(status_code=413, detail=f"❌ 한 번에 최대 {MAX_BATCH_ARTICLES}건까지 등록할 수 있습니다.")
+
+    try:
+        # ✅ 1️⃣ Article 정보 일괄 저장 (한 트랜잭션, 배치 내 중복 URL은 한 건으로 처리)
+        results = get_or_create_articles(session, [Article(
+            title=dto.title, source_url=dto.link, source_created_at=dto.timestamp)
+            for dto in article_request_dtos])
+
+        # ✅ 2️⃣ 영상이 없는 기사만 작업 등록 (같은 기사의 작업은 큐에서 한 건으로 합쳐짐)
+        items = []
+        for dto, (article, created) in zip(article_request_dtos, results):
+            item = {"link": dto.link, "article_id": article.id, "created": created}
+            if article.video_url:
+                item.update(status="published", video_url=article.video_url, thumbnail_url=article.thumbnail_url)
+            else:
+                job = render_queue.submit(article.id, dto.title, dto.content)
+                item.update(status=job.status, job_id=job.id)
+            items.append(item)
+
+        logger.info(f"📥 기사 일괄 저장 완료: 신규 {sum(created for _, created in results)}건 / {len(results)}건")
+        return {"status": "accepted", "message": "✅ 기사 숏폼 생성 작업 일괄 등록!", "data": items}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"❌ 서버 오류: {e}")
 
+# ✅ FastAPI 엔드포인트: 숏폼 생성 작업 상태 조회
+
+
+@app.get("/ai/video/{job_id}", status_code=200)
+def get_render_job_status(job_id: str):
+    job = render_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="❌ 존재하지 않는 작업입니다.")
+    return {"status": "success", "message": "✅ 작업 상태 조회 성공!", "data": job.to_dict()}
+
+# 📌 조회 API 응답 캐시 + 조건부 요청(ETag) 처리
+async def cached_response(request: Request, namespace: str, params: dict, loader, message: str):
+    entry = await response_cache.aget_or_load(namespace, params, loader)
+    headers = {
+        "ETag": entry["etag"],
+        "Last-Modified": entry["last_modified"],
+        "Cache-Control": "public, max-age=0, must-revalidate",
+    }
+
+    # 클라이언트/CDN이 가진 버전과 같으면 본문 없이 304 응답
+    if_none_match = request.headers.get("if-none-match", "")
+    if entry["etag"] in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    # 조회 결과는 이미 JSON 타입(dict/list/str/int)만 담고 있으므로 jsonable_encoder 없이 바로 orjson 직렬화
+    return ORJSONResponse({"status": "success", "message": message, "data": entry["data"]}, headers=headers)
+
 # ✅ FASTAPI 엔드포인트: Frontend에서 호출하는 Video List 조회 API ( Infinite Scroll )
 @app.get("/api/articles", status_code=200)
-def get_article_list(page: int = 1, session=Depends(get_session)):
-    """✅ 최신순으로 비디오 리스트 조회 (Infinite Scroll)"""
+async def get_article_list(request: Request, page: int = 1, before_id: Optional[int] = None,
+                           session=Depends(get_async_session)):
+    """✅ 최신순으로 비디오 리스트 조회 (Infinite Scroll)
+
+    before_id(이전 응답의 nextCursor)를 넘기면 커서 방식으로 다음 페이지를 조회합니다.
+    """
     try:
-        return {"status": "success", "message": "✅ 기사 페이징 조회 성공!", "data": get_articles(session, page)}
+        return await cached_response(
+            request, "articles", {"page": page, "before_id": before_id},
+            lambda: session.run_sync(get_articles, page, before_id), "✅ 기사 페이징 조회 성공!")
     except Exception as e:
         logger.error(f"❌ 비디오 리스트 조회 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 # ✅ FASTAPI 엔드포인트: Frontend에서 호출하는 Video 상세 조회 API   
 @app.get("/api/articles/{article_id}", status_code=200)
-def get_each_article(article_id: int, session=Depends(get_session)):
+async def get_each_article(request: Request, article_id: int, session=Depends(get_async_session)):
     """✅ 기사 상세 조회"""
     try:
-        return {"status": "success", "message": "✅ 기사 상세 조회 성공!", "data": get_article_detail(session, article_id)}
+        return await cached_response(
+            request, "article", {"id": article_id},
+            lambda: session.run_sync(get_article_detail, article_id), "✅ 기사 상세 조회 성공!")
     except Exception as e:
         logger.error(f"❌ 기사 상세 조회 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -80,15 +189,24 @@ def get_each_article(article_id: int, session=Depends(get_session)):
 
 # ✅ FASTAPI 엔드포인트: Frontend에서 호출하는 Video 검색 API
 @app.get("/api/search", status_code=200)
-def search_article_list(keyword: str, session=Depends(get_session)):
-    """ ✅ 검색어로 숏폼 검색 """
+async def search_article_list(request: Request, keyword: str, page: int = 1,
+                              session=Depends(get_async_session)):
+    """ ✅ 검색어로 숏폼 검색 (관련도순, 페이지당 20건) """
     try:
-        return {"status": "success", "message": "✅ 기사 검색 성공!", "data": search_articles(session, keyword)}
+        return await cached_response(
+            request, "search", {"keyword": keyword, "page": page},
+            lambda: session.run_sync(search_articles, keyword, page), "✅ 기사 검색 성공!")
     except Exception as e:
         logger.error(f"❌ 비디오 검색 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ✅ FASTAPI 엔드포인트: Prometheus 메트릭 (DB 커넥션 풀 대기 시간 등)
+@app.get("/metrics")
+def get_metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # 🖥️ 서버 실행: uvicorn
 if __name__ == "__main__":
     import uvicorn
@@ -1,6 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, Index, Integer, String, Text
 from sqlalchemy.orm import declarative_base
-from db.connection import engine
 
 Base = declarative_base()
 
@@ -11,10 +10,13 @@ class Article(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)  # 자동 증가 ID
     title = Column(String(255), index=True, nullable=False)  # 제목
     source_url = Column(String(255), nullable=False)  # 원본 기사 URL
+    url_hash = Column(String(64), unique=True, nullable=True)  # 정규화된 원본 URL의 sha256 (중복 수집 방지)
     video_url = Column(String(255), nullable=True)  # 생성된 비디오 URL (AWS S3)
     thumbnail_url = Column(String(255), nullable=True)  # 생성된 썸네일 이미지 URL (AWS S3)
     source_created_at = Column(String(50), nullable=False)  # 기사 원본 생성 시간 (ISO 8601)
     # content= Column(Text, nullable=False)  # 내용
 
-# 📌 DB 테이블 생성 (최초 실행 시 필요)
-Base.metadata.create_all(bind=engine)
+    __table_args__ = (
+        # 제목 검색용 FULLTEXT 인덱스 (한국어는 띄어쓰기 단위로 검색되지 않도록 ngram 파서 사용)
+        Index("ft_articles_title", "title", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+    )
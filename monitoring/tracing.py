@@ -0,0 +1,261 @@
+import contextvars
+import cProfile
+import os
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from prometheus_client import Counter, Histogram
+
+from config import logger, config
+
+# 📊 파이프라인 단계별 메트릭 (stage: scenario, image, thumbnail, tts, overlay, encode, concat, upload, publish)
+STAGE_SECONDS = Histogram(
+    "bitenews_pipeline_stage_seconds",
+    "영상 생성 파이프라인 단계별 소요 시간 (씬 단위 단계는 씬마다 기록)",
+    ["stage"],
+    buckets=(0.1, 0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300, 600),
+)
+STAGE_CPU_SECONDS = Counter(
+    "bitenews_pipeline_stage_cpu_seconds",
+    "영상 생성 파이프라인 단계별 CPU 시간 (ffmpeg 등 자식 프로세스 포함)",
+    ["stage"],
+)
+STAGE_BYTES = Counter(
+    "bitenews_pipeline_stage_bytes",
+    "영상 생성 파이프라인 단계별 생성 바이트",
+    ["stage"],
+)
+CACHE_LOOKUPS = Counter(
+    "bitenews_asset_cache_lookups",
+    "생성 결과물 캐시 조회 수",
+    ["namespace", "result"],
+)
+
+# 📊 LLM 호출 메트릭 (call: generate, repair)
+LLM_CALL_SECONDS = Histogram(
+    "bitenews_llm_call_seconds",
+    "LLM 호출 소요 시간",
+    ["call", "status"],
+    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120),
+)
+LLM_TOKENS = Counter(
+    "bitenews_llm_tokens",
+    "LLM 사용 토큰 수",
+    ["call", "type"],
+)
+
+# 현재 실행 중인 작업의 trace / 현재 스레드에서 진행 중인 span
+_current_trace = contextvars.ContextVar("pipeline_trace", default=None)
+_current_span = contextvars.ContextVar("pipeline_span", default=None)
+
+
+def cpu_time() -> float:
+    """현재 스레드 CPU 시간 + 종료된 자식 프로세스(ffmpeg 등) CPU 시간
+
+    자식 프로세스 시간은 프로세스 단위로 합산되므로, 여러 작업이 동시에 ffmpeg를 실행하면 근사값입니다.
+    (프로세스 풀 작업은 한 번에 하나씩 실행되므로 정확)
+    """
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.thread_time() + children.ru_utime + children.ru_stime
+
+
+def file_size(path) -> int:
+    try:
+        return os.path.getsize(path) if path else 0
+    except OSError:
+        return 0
+
+
+@dataclass
+class Span:
+    stage: str
+    scene: Optional[int] = None
+    wall: float = 0.0
+    cpu: float = 0.0
+    bytes: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def add_bytes(self, size: int):
+        self.bytes += size
+
+    def add_file(self, path):
+        self.bytes += file_size(path)
+
+
+class PipelineTrace:
+    """✅ 영상 생성 1회 실행의 단계별 기록 (wall / CPU 시간, 생성 바이트, 캐시 히트)"""
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id
+        self.spans = []
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, stage: str, scene: Optional[int] = None):
+        """현재 스레드에서 실행되는 단계 측정 (스레드 풀 작업은 작업 안에서 span을 엽니다)"""
+        span = Span(stage, scene)
+        try:
+            with self.measure(span):
+                yield span
+        finally:
+            self._add(span)
+
+    @contextmanager
+    def measure(self, span: Span):
+        """현재 스레드에서 실행되는 구간의 시간을 span에 누적 (기록은 add로 1회)
+
+        캐시 조회 → 일괄 합성처럼 한 씬의 작업이 여러 구간/스레드에 나뉘어 실행되는 단계용
+        """
+        token = _current_span.set(span)
+        start_wall, start_cpu = time.perf_counter(), cpu_time()
+        try:
+            yield span
+        finally:
+            span.wall += time.perf_counter() - start_wall
+            span.cpu += cpu_time() - start_cpu
+            _current_span.reset(token)
+
+    def add(self, span: Span):
+        """measure로 측정한 span 기록"""
+        self._add(span)
+
+    def record(self, stage: str, wall: float, cpu: float, scene: Optional[int] = None, size: int = 0):
+        """다른 프로세스(프로세스 풀)에서 측정한 단계 기록"""
+        self._add(Span(stage, scene, wall=wall, cpu=cpu, bytes=size))
+
+    def _add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+        STAGE_SECONDS.labels(span.stage).observe(span.wall)
+        STAGE_CPU_SECONDS.labels(span.stage).inc(span.cpu)
+        STAGE_BYTES.labels(span.stage).inc(span.bytes)
+
+    def summary(self) -> dict:
+        """단계별 합계 + span 목록 (작업 상태 조회 API / 로그용)"""
+        with self._lock:
+            spans = list(self.spans)
+
+        stages = {}
+        for span in spans:
+            total = stages.setdefault(span.stage, {
+                "count": 0, "wall": 0.0, "cpu": 0.0, "bytes": 0, "cache_hits": 0, "cache_misses": 0})
+            total["count"] += 1
+            total["wall"] = round(total["wall"] + span.wall, 3)
+            total["cpu"] = round(total["cpu"] + span.cpu, 3)
+            total["bytes"] += span.bytes
+            total["cache_hits"] += span.cache_hits
+            total["cache_misses"] += span.cache_misses
+
+        return {
+            "run_id": self.run_id,
+            "wall": round(time.perf_counter() - self._started, 3),
+            "stages": stages,
+            "spans": [asdict(span) for span in spans],
+        }
+
+
+@contextmanager
+def use_trace(trace: PipelineTrace):
+    """with 블록 안의 파이프라인 코드가 current_trace()로 trace를 사용하도록 설정"""
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def current_trace() -> PipelineTrace:
+    """현재 작업의 trace (없으면 메트릭만 기록하는 임시 trace)
+
+    스레드 풀 작업에는 contextvar가 전달되지 않으므로, 작업을 제출하는 쪽에서 먼저 조회해 넘겨야 합니다.
+    """
+    return _current_trace.get() or PipelineTrace()
+
+
+def record_cache(namespace: str, hit: bool):
+    """캐시 조회 결과 기록 (현재 스레드에서 진행 중인 span에도 반영)"""
+    CACHE_LOOKUPS.labels(namespace, "hit" if hit else "miss").inc()
+    span = _current_span.get()
+    if span is not None:
+        if hit:
+            span.cache_hits += 1
+        else:
+            span.cache_misses += 1
+
+
+def record_bytes(size: int):
+    """현재 스레드에서 진행 중인 span의 생성 바이트에 추가 (스트리밍 업로드 등 파일이 없는 출력용)"""
+    span = _current_span.get()
+    if span is not None:
+        span.add_bytes(size)
+
+
+def record_llm_call(call: str, seconds: float, prompt_tokens: int, completion_tokens: int, status: str):
+    """LLM 호출 1회의 소요 시간 / 토큰 수 기록"""
+    LLM_CALL_SECONDS.labels(call, status).observe(seconds)
+    LLM_TOKENS.labels(call, "prompt").inc(prompt_tokens)
+    LLM_TOKENS.labels(call, "completion").inc(completion_tokens)
+    logger.info(f"[LLM 호출] {call} {status}: {seconds:.2f}s, "
+                f"토큰 prompt {prompt_tokens} / completion {completion_tokens}")
+
+
+class StageTimer:
+    """✅ 프로세스 풀 작업용 단계 측정 - 결과와 함께 반환해 부모 프로세스에서 trace.record로 반영"""
+
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str):
+        stage = {"stage": name, "wall": 0.0, "cpu": 0.0, "size": 0}
+        start_wall, start_cpu = time.perf_counter(), cpu_time()
+        try:
+            yield stage
+        finally:
+            stage["wall"] = time.perf_counter() - start_wall
+            stage["cpu"] = cpu_time() - start_cpu
+            self.stages.append(stage)
+
+
+@contextmanager
+def profile_run(run_id: str, enabled: bool):
+    """enabled이면 실행 1회를 프로파일링해 PROFILE_DIR에 저장 (cprofile: .prof, pyinstrument: .html)
+
+    파이프라인 스레드만 측정되며, 스레드/프로세스 풀 작업은 span 기록으로 확인합니다.
+    """
+    if not enabled:
+        yield
+        return
+
+    os.makedirs(config["PROFILE_DIR"], exist_ok=True)
+    path = os.path.join(config["PROFILE_DIR"], run_id)
+
+    if config["PROFILER"] == "pyinstrument":
+        from pyinstrument import Profiler  # 선택 의존성
+
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            path += ".html"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            path += ".prof"
+            profiler.dump_stats(path)
+
+    logger.info(f"[프로파일 저장] {path}")
@@ -0,0 +1,71 @@
+import glob
+import os
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from lambda_function import EXTRACTORS, HEADLINE_LIMIT
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "html")
+FIXTURES = sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html")))
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_fixtures_exist():
+    assert FIXTURES, f"fixture 없음: {FIXTURE_DIR}"
+
+
+# ✅ lxml 추출기는 모든 저장된 페이지에서 BeautifulSoup 추출기와 같은 결과를 내야 함
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_lxml_matches_bs4(path):
+    with open(path, "r", encoding="utf-8") as f:
+        html = f.read()
+
+    soup, lxml = EXTRACTORS["bs4"], EXTRACTORS["lxml"]
+    assert lxml.extract_article(html) == soup.extract_article(html)
+    assert lxml.extract_headlines(html, HEADLINE_LIMIT) == soup.extract_headlines(html, HEADLINE_LIMIT)
+
+
+@pytest.mark.parametrize("name", sorted(EXTRACTORS))
+def test_extract_article(name):
+    result = EXTRACTORS[name].extract_article(read_fixture("article_politics.html"))
+
+    assert result["title"] == '여야, 추경 편성 논의 본격화…"민생 우선"'
+    assert result["timestamp"] == "2025-03-14 09:21:05"  # 수정 시간이 아닌 입력 시간
+    assert "관계부처 합동 회의" in result["content"]
+    assert "adSlot" not in result["content"]  # 본문 안 스크립트 제외
+
+
+@pytest.mark.parametrize("name", sorted(EXTRACTORS))
+def test_extract_article_without_timestamp(name):
+    result = EXTRACTORS[name].extract_article(read_fixture("article_no_timestamp.html"))
+
+    assert result["title"] == "시간 정보가 없는 기사"
+    assert result["timestamp"] is None
+
+
+@pytest.mark.parametrize("name", sorted(EXTRACTORS))
+def test_extract_headlines(name):
+    headlines = EXTRACTORS[name].extract_headlines(read_fixture("section_politics.html"), HEADLINE_LIMIT)
+
+    # 관련 기사(중첩 sa_item)와 최신 기사 목록은 제외하고 헤드라인만 최대 HEADLINE_LIMIT건
+    assert len(headlines) == HEADLINE_LIMIT
+    assert headlines[0] == {
+        "title": "정치 헤드라인 1 & 후속 <속보>",
+        "link": "https://n.news.naver.com/mnews/article/001/0015200001",
+    }
+
+
+@pytest.mark.parametrize("name", sorted(EXTRACTORS))
+def test_extract_headlines_short_and_missing(name):
+    extractor = EXTRACTORS[name]
+
+    assert len(extractor.extract_headlines(read_fixture("section_economy_short.html"), HEADLINE_LIMIT)) == 3
+    # 헤드라인 없이 최신 기사 목록만 있는 섹션 → 빈 목록, 목록 자체가 없는 페이지 → None
+    assert extractor.extract_headlines(read_fixture("section_no_headline.html"), HEADLINE_LIMIT) == []
+    assert extractor.extract_headlines(read_fixture("article_politics.html"), HEADLINE_LIMIT) is None
@@ -0,0 +1,158 @@
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Callable, ContextManager, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from config import logger, config
+
+
+def with_retries(func):
+    """원격 TTS 요청 재시도 (지수 백오프, 최대 TTS_MAX_ATTEMPTS회)"""
+    return retry(
+        stop=stop_after_attempt(config["TTS_MAX_ATTEMPTS"]),
+        wait=wait_exponential(multiplier=0.5, max=8),
+        reraise=True,
+    )(func)
+
+
+class TTSBackend(ABC):
+    """✅ TTS 백엔드 인터페이스
+
+    - synthesize(text, output_path): 텍스트 1건을 음성 파일로 저장 (필수 구현)
+    - synthesize_batch(texts, output_paths): 여러 건을 한 번에 처리 (기본 구현은 스레드 풀 동시 요청)
+      item_context(i)를 넘기면 i번째 항목 합성을 그 context 안에서 실행 (씬별 소요 시간 측정용)
+    """
+    name = "base"
+    extension = ".mp3"
+
+    def cache_params(self) -> tuple:
+        """캐시 키에 포함할 설정값 (백엔드/모델/목소리가 바뀌면 다른 캐시 사용)"""
+        return (self.name,)
+
+    @abstractmethod
+    def synthesize(self, text: str, output_path: str):
+        ...
+
+    def _synthesize_item(self, text: str, output_path: str, context: ContextManager) -> bool:
+        with context:
+            try:
+                self.synthesize(text, output_path)
+                return True
+            except Exception as e:
+                logger.error(f"[TTS 생성 오류] ({self.name}) {output_path}: {e}")
+                return False
+
+    def synthesize_batch(self, texts: List[str], output_paths: List[str],
+                         item_context: Optional[Callable[[int], ContextManager]] = None) -> List[bool]:
+        """입력 순서대로 성공 여부 반환"""
+        item_context = item_context or (lambda index: nullcontext())
+
+        def run(index):
+            return self._synthesize_item(texts[index], output_paths[index], item_context(index))
+
+        max_workers = max(1, min(config["TTS_CONCURRENCY"], len(texts)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts") as executor:
+            return list(executor.map(run, range(len(texts))))
+
+
+class GTTSBackend(TTSBackend):
+    """Google Translate TTS (gTTS) - 네트워크 필요, 받은 MP3를 그대로 저장"""
+    name = "gtts"
+    extension = ".mp3"
+
+    def cache_params(self) -> tuple:
+        return (self.name, "ko")
+
+    @with_retries
+    def synthesize(self, text, output_path):
+        from gtts import gTTS
+
+        tts = gTTS(text=text, lang='ko', tld="co.kr", slow=False)
+        with open(output_path, "wb") as f:
+            tts.write_to_fp(f)
+
+
+class OpenAITTSBackend(TTSBackend):
+    """OpenAI TTS API (/v1/audio/speech) - 커넥션을 재사용하는 세션으로 요청"""
+    name = "openai"
+    extension = ".mp3"
+    API_URL = "https://api.openai.com/v1/audio/speech"
+
+    def __init__(self):
+        self.model = config["OPENAI_TTS_MODEL"]
+        self.voice = config["OPENAI_TTS_VOICE"]
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=config["TTS_CONCURRENCY"]))
+        self._session.headers["Authorization"] = f"Bearer {config['OPENAI_API_KEY']}"
+
+    def cache_params(self) -> tuple:
+        return (self.name, self.model, self.voice)
+
+    @with_retries
+    def synthesize(self, text, output_path):
+        response = self._session.post(self.API_URL, json={
+            "model": self.model,
+            "voice": self.voice,
+            "input": text,
+            "response_format": "mp3",
+        }, timeout=60)
+        response.raise_for_status()
+        with open(output_path, "wb") as f:
+            f.write(response.content)
+
+
+class MeloTTSBackend(TTSBackend):
+    """MeloTTS 로컬 엔진 (CPU, 네트워크 불필요) - melotts 패키지 별도 설치 필요
+
+    모델은 프로세스당 1회 로드하고, 여러 문장은 로드된 모델로 한 번에 순차 합성합니다.
+    출력은 무손실 WAV (최종 AAC 인코딩 전까지 손실 압축 없음)
+    """
+    name = "melo"
+    extension = ".wav"
+
+    def __init__(self):
+        self._lock = threading.Lock()  # 모델은 스레드 안전하지 않음
+
+    def cache_params(self) -> tuple:
+        return (self.name, "KR")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_model():
+        from melo.api import TTS  # 선택 의존성
+
+        model = TTS(language="KR", device="cpu")
+        logger.info("MeloTTS 모델 로드 완료")
+        return model
+
+    def synthesize(self, text, output_path):
+        model = self._load_model()
+        with self._lock:
+            model.tts_to_file(text, model.hps.data.spk2id["KR"], output_path, quiet=True)
+
+    def synthesize_batch(self, texts, output_paths, item_context=None):
+        item_context = item_context or (lambda index: nullcontext())
+        return [self._synthesize_item(text, output_path, item_context(index))
+                for index, (text, output_path) in enumerate(zip(texts, output_paths))]
+
+
+TTS_BACKENDS = {
+    GTTSBackend.name: GTTSBackend,
+    OpenAITTSBackend.name: OpenAITTSBackend,
+    MeloTTSBackend.name: MeloTTSBackend,
+}
+
+
+@lru_cache(maxsize=None)
+def get_tts_backend() -> TTSBackend:
+    """설정(TTS_BACKEND)에 맞는 TTS 백엔드 (최초 사용 시 1회 생성)"""
+    backend_name = config["TTS_BACKEND"]
+    if backend_name not in TTS_BACKENDS:
+        raise ValueError(f"지원하지 않는 TTS_BACKEND: {backend_name} ({', '.join(TTS_BACKENDS)})")
+    return TTS_BACKENDS[backend_name]()
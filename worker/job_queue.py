@@ -0,0 +1,133 @@
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from config import logger
+
+# 📌 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCESS = "success"
+JOB_FAILED = "failed"
+
+# 완료된 작업 상태를 메모리에 보관할 최대 개수
+MAX_FINISHED_JOBS = 1000
+
+
+# 📌 영상 생성 작업
+@dataclass
+class RenderJob:
+    article_id: int
+    title: str
+    content: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JOB_QUEUED
+    stage: str = JOB_QUEUED  # 현재 진행 중인 파이프라인 단계
+    error: Optional[str] = None
+    profile: bool = False  # 이 작업 1회 프로파일링 여부
+    trace: Optional[dict] = None  # 단계별 소요 시간 기록 (완료 후 설정)
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "article_id": self.article_id,
+            "status": self.status,
+            "stage": self.stage,
+            "error": self.error,
+            "trace": self.trace,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class RenderJobQueue:
+    """✅ 영상 생성 작업 큐 + 워커 스레드 풀
+
+    handler(job, report) 형태의 함수를 워커 스레드에서 실행하며,
+    handler는 report(stage)로 진행 단계를 갱신할 수 있습니다.
+    """
+
+    def __init__(self, handler: Callable[[RenderJob, Callable[[str], None]], None], num_workers: int = 2):
+        self._handler = handler
+        self._num_workers = max(1, num_workers)
+        self._queue = queue.Queue()
+        self._jobs = OrderedDict()
+        self._active_jobs = {}  # article_id -> 대기/진행 중인 작업
+        self._lock = threading.Lock()
+        self._workers = []
+
+    def start(self):
+        """워커 스레드 시작"""
+        for i in range(self._num_workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"render-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        logger.info(f"🚀 영상 생성 워커 {self._num_workers}개 시작")
+
+    def stop(self, timeout: float = 5.0):
+        """워커 스레드 종료 (진행 중인 작업은 끝날 때까지 대기하지 않음)"""
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+
+    def submit(self, article_id: int, title: str, content: str, profile: bool = False) -> RenderJob:
+        """작업을 큐에 등록하고 즉시 반환 (같은 기사의 작업이 이미 대기/진행 중이면 그 작업을 반환)"""
+        with self._lock:
+            active_job = self._active_jobs.get(article_id)
+            if active_job:
+                return active_job
+
+            job = RenderJob(article_id=article_id, title=title, content=content, profile=profile)
+            self._jobs[job.id] = job
+            self._active_jobs[article_id] = job
+            self._trim_finished_jobs()
+        self._queue.put(job)
+        logger.info(f"📥 영상 생성 작업 등록: {job.id} (article {article_id})")
+        return job
+
+    def get(self, job_id: str) -> Optional[RenderJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _update(self, job: RenderJob, **changes):
+        with self._lock:
+            for key, value in changes.items():
+                setattr(job, key, value)
+            job.updated_at = time.time()
+
+    def _trim_finished_jobs(self):
+        """오래된 완료 작업부터 정리 (lock 안에서 호출)"""
+        overflow = len(self._jobs) - MAX_FINISHED_JOBS
+        if overflow <= 0:
+            return
+        for job_id in [jid for jid, j in self._jobs.items() if j.status in (JOB_SUCCESS, JOB_FAILED)][:overflow]:
+            del self._jobs[job_id]
+
+    def _worker_loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+
+            self._update(job, status=JOB_RUNNING, stage="started")
+            try:
+                self._handler(job, lambda stage: self._update(job, stage=stage))
+                self._update(job, status=JOB_SUCCESS, stage="done")
+                logger.info(f"✅ 영상 생성 작업 완료: {job.id} (article {job.article_id})")
+            except Exception as e:
+                self._update(job, status=JOB_FAILED, error=str(e))
+                logger.error(f"❌ 영상 생성 작업 실패: {job.id} (article {job.article_id}) : {e}")
+            finally:
+                # 본문은 작업이 끝나면 더 이상 필요 없으므로 메모리에서 해제
+                job.content = ""
+                with self._lock:
+                    self._active_jobs.pop(job.article_id, None)
+                self._queue.task_done()
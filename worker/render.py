@@ -0,0 +1,68 @@
+from config import logger, config
+from cache.response_cache import response_cache
+from db.connection import SessionLocal
+from db.crud import update_article
+from monitoring.tracing import PipelineTrace, file_size, profile_run, use_trace
+from worker.job_queue import RenderJob
+
+
+# ✅ 영상 생성 작업 처리 (워커 스레드에서 실행)
+def process_render_job(job: RenderJob, report):
+    """기사 1건에 대해 썸네일 & 비디오 생성 → S3 업로드 → DB 업데이트"""
+    # 렌더링 스택(PIL, ffmpeg 헬퍼, boto3 등)은 첫 작업에서 로드 (조회 API만 처리하는 서버는 로드하지 않음)
+    from article import create_article, create_workspace, remove_workspace
+    from aws.s3 import upload_files_to_s3, upload_stream_to_s3, upload_to_s3
+
+    # 작업별 전용 디렉토리에서 생성 (동시에 여러 기사를 렌더링해도 파일이 섞이지 않음)
+    workspace = create_workspace(job.id)
+    thumbnail_key = f"article/{job.article_id}/thumbnail.png"
+    video_key = f"article/{job.article_id}/video.mp4"
+
+    # 단일 패스 렌더링이면 ffmpeg 출력을 파일로 저장하지 않고 바로 S3로 스트리밍 가능
+    stream_video = config["S3_STREAM_UPLOAD"] and config["RENDER_MODE"] == "single_pass"
+    video_sink = (lambda stream: upload_stream_to_s3(stream, video_key, "video/mp4")) if stream_video else None
+
+    # 단계별 소요 시간 기록 (+ 요청 시 프로파일링)
+    trace = PipelineTrace(job.id)
+    try:
+        with use_trace(trace), profile_run(job.id, job.profile or config["PROFILE_RENDER"]):
+            try:
+                # ✅ 1️⃣ 썸네일 & 비디오 생성
+                report("rendering")
+                video_result, thumbnail_path = create_article(
+                    content=job.content, title=job.title, workspace=workspace, video_sink=video_sink)
+                if not video_result or not thumbnail_path:
+                    raise RuntimeError("썸네일 또는 비디오 생성 실패")
+                logger.info(f"✅ 비디오 생성 완료: {job.article_id} : {job.title}")
+
+                # ✅ 2️⃣ S3 업로드 (썸네일 + 영상 동시 업로드)
+                report("uploading")
+                with trace.span("upload") as span:
+                    if stream_video:
+                        video_url = video_result
+                        thumbnail_url = upload_to_s3(thumbnail_path, thumbnail_key, "image/png")
+                        span.add_file(thumbnail_path)
+                    else:
+                        thumbnail_url, video_url = upload_files_to_s3([
+                            (thumbnail_path, thumbnail_key, "image/png"),
+                            (video_result, video_key, "video/mp4"),
+                        ])
+                        span.add_bytes(file_size(thumbnail_path) + file_size(video_result))
+                logger.info(f"✅ S3 업로드 완료: {job.article_id} : {job.title}")
+            finally:
+                remove_workspace(workspace)
+
+            # ✅ 3️⃣ Article 정보 업데이트 (S3 URL)
+            report("publishing")
+            with trace.span("publish"):
+                with SessionLocal() as session:
+                    update_article(session, job.article_id, video_url, thumbnail_url)
+            logger.info(f"✅ 기사 DB 업데이트 완료: {job.article_id} : {job.title}")
+
+            # ✅ 4️⃣ 새 기사가 게시되었으므로 조회 API 응답 캐시 무효화
+            response_cache.invalidate()
+    finally:
+        # 실패한 작업도 어느 단계에서 시간이 걸렸는지 확인할 수 있도록 기록
+        job.trace = trace.summary()
+        stage_walls = {stage: total["wall"] for stage, total in job.trace["stages"].items()}
+        logger.info(f"[파이프라인 소요 시간] {job.id}: 전체 {job.trace['wall']}s, 단계별 {stage_walls}")